@@ -0,0 +1,48 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+import fastf1
+from standin_server import fixture_path, make_handler
+from logic.http_cache import init_cache, stats
+
+
+FIXTURE_PATH = "/livetiming/static/check.json"
+FIXTURE_BODY = b'{"ok":1}'
+
+
+def main() -> None:
+    """
+    Check the HTTP cache statistics against a stand-in server: one request
+    that misses and two that hit the cache must be counted exactly once each.
+    """
+    fixtures = tempfile.mkdtemp()
+    fixture = fixture_path(fixtures, FIXTURE_PATH)
+    with open(fixture, "wb") as f:
+        f.write(FIXTURE_BODY)
+    with open(fixture + ".json", "w", encoding="utf-8") as f:
+        json.dump({"path": FIXTURE_PATH, "status": 200, "content_type": "application/json"}, f)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler("replay", fixtures))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    init_cache(tempfile.mkdtemp())
+    session = fastf1.Cache._requests_session_cached
+    url = f"http://127.0.0.1:{server.server_address[1]}{FIXTURE_PATH}"
+
+    stats.reset()
+    for _ in range(3):
+        session.get(url).raise_for_status()
+    server.shutdown()
+
+    expected = {"requests": 3, "hits": 2, "misses": 1, "fetched_bytes": len(FIXTURE_BODY)}
+    actual = {key: stats.snapshot()[key] for key in expected}
+    if actual != expected:
+        print(f"❌ Transport stats mismatch: expected {expected}, got {actual}")
+        sys.exit(1)
+    print(f"✅ Transport stats: {actual}")
+
+
+if __name__ == "__main__":
+    main()
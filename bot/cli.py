@@ -1,12 +1,20 @@
 import argparse
+import asyncio
+import os
 import sys
 import logging
+from logic.http_cache import init_cache, format_cache_stats
 from logic.session_loader import load_session
+from logic.storage import run_gc, format_gc_summary
 from logic.best_laps import print_best_laps, generate_best_laps_image, generate_laptime_distribution_image
 from logic.results import print_results, generate_results_image, export_results_csv
 from logic.position_changes import generate_position_changes_image
 from logic.strategy import generate_strategy_image
 from logic.driver_styling import generate_driver_styling_image
+from logic.compare import print_compare, generate_compare_image
+from logic.degradation import compute_degradation, print_degradation, generate_degradation_image, generate_degradation_table_image
+from logic.multi_session import parse_years, compare_sessions, print_multi_session, generate_multi_session_image, METRICS
+from logic.live import replay_recording, run_feed
 
 
 def main() -> None:
@@ -17,9 +25,9 @@ def main() -> None:
     logging.getLogger("fastf1.req").setLevel(logging.ERROR)
     logging.getLogger("fastf1.core").setLevel(logging.ERROR)
     parser = argparse.ArgumentParser(description="CLI for analyzing F1 sessions via FastF1")
-    parser.add_argument("--year", type=int, required=True, help="Season year, e.g., 2024")
-    parser.add_argument("--gp", type=str, required=True, help="Grand Prix name, e.g., Monaco")
-    parser.add_argument("--type", type=str, required=True, choices=["FP1", "FP2", "FP3", "Q", "R", "SQ", "S"], help="Session type: FP1, FP2, FP3, Q, R, S")
+    parser.add_argument("--year", type=int, help="Season year, e.g., 2024")
+    parser.add_argument("--gp", type=str, help="Grand Prix name, e.g., Monaco")
+    parser.add_argument("--type", type=str, choices=["FP1", "FP2", "FP3", "Q", "R", "SQ", "S"], help="Session type: FP1, FP2, FP3, Q, R, S")
 
     parser.add_argument("--best-laps", action="store_true", help="Display best laps and save image")
     parser.add_argument("--results", action="store_true", help="Display results and save image")
@@ -27,8 +35,61 @@ def main() -> None:
     parser.add_argument("--strategy", action="store_true", help="Display tire strategy graph")
     parser.add_argument("--driver-styling", action="store_true", help="Display driver lap performance by compound")
     parser.add_argument("--driver", type=str, help="Driver abbreviation, e.g., LEC")
+    parser.add_argument("--compare", type=str, nargs=2, metavar=("DRV1", "DRV2"), help="Compare two drivers' fastest laps, e.g., --compare VER LEC")
+    parser.add_argument("--degradation", action="store_true", help="Display tyre degradation per stint")
+    parser.add_argument("--fuel-effect", type=float, default=0.0, help="Fuel correction for --degradation, seconds per lap")
+
+    parser.add_argument("--multi", type=str, choices=list(METRICS), help="Compare a metric across sessions given by --years and --gp")
+    parser.add_argument("--years", type=str, help="With --multi: years, e.g., 2024, 2023-2024 or 2022,2024")
+    parser.add_argument("--drivers", type=str, help="With --multi: comma-separated drivers, e.g., LEC,VER")
+    parser.add_argument("--cache-stats", action="store_true", help="Print HTTP cache hit rate and fetched bytes")
+    parser.add_argument("--gc", action="store_true", help="Enforce size/age quotas on data/ and the FastF1 cache")
+    parser.add_argument("--dry-run", action="store_true", help="With --gc, only report what would be removed")
+    parser.add_argument("--live-replay", type=str, help="Replay a saved FastF1 livetiming recording")
+    parser.add_argument("--live-speed", type=float, help="Replay speed multiplier (default: no delays)")
 
     args = parser.parse_args()
+    init_cache()
+
+    if args.gc:
+        print(f"🧹 {format_gc_summary(run_gc(dry_run=args.dry_run))}")
+
+    if args.live_replay:
+        async def on_update(path):
+            print(f"📈 Live charts updated: {path}")
+        try:
+            feed = os.path.splitext(os.path.basename(args.live_replay))[0]
+            state = asyncio.run(run_feed(replay_recording(args.live_replay, args.live_speed), feed, on_update))
+            print(f"📡 Replayed {state.messages} messages.")
+        except Exception as e:
+            print(f"❌ Error replaying live timing: {e}")
+            sys.exit(1)
+
+    if args.multi:
+        if not (args.years or args.year) or not args.gp or not args.type:
+            parser.error("--multi requires --years (or --year), --gp (comma list or lastN) and --type")
+        try:
+            years = parse_years(args.years or args.year)
+        except ValueError:
+            years = []
+        if not years:
+            parser.error(f"invalid --years value: {args.years or args.year!r}, expected e.g. 2024, 2022-2024 or 2022,2024")
+        drivers = [drv.strip().upper() for drv in args.drivers.split(",")] if args.drivers else None
+        try:
+            summaries = compare_sessions(years, args.gp, args.type.upper(), args.multi)
+            print_multi_session(summaries, args.multi, drivers)
+            query = f"{args.years or args.year}_{args.gp}_{args.type}_{args.drivers or 'top'}"
+            path = generate_multi_session_image(summaries, args.multi, query, drivers)
+            print(f"📈 Multi-session comparison saved to: {path}")
+        except Exception as e:
+            print(f"❌ Error comparing sessions: {e}")
+            sys.exit(1)
+        return
+
+    if (args.gc or args.live_replay) and args.year is None and args.gp is None and args.type is None:
+        return
+    if args.year is None or args.gp is None or args.type is None:
+        parser.error("--year, --gp and --type are required")
 
     try:
         session = load_session(args.year, args.gp, args.type.upper())
@@ -85,6 +146,31 @@ def main() -> None:
             print(f"❌ Error generating driver styling image: {e}")
             sys.exit(1)
 
+    if args.compare:
+        drv1, drv2 = (drv.upper() for drv in args.compare)
+        try:
+            print_compare(session, drv1, drv2)
+            path = generate_compare_image(session, drv1, drv2)
+            print(f"📈 Driver comparison saved to: {path}")
+        except Exception as e:
+            print(f"❌ Error generating driver comparison: {e}")
+            sys.exit(1)
+
+    if args.degradation:
+        try:
+            result = compute_degradation(session, args.fuel_effect)
+            print_degradation(result)
+            path = generate_degradation_table_image(session, result)
+            print(f"📈 Degradation table saved to: {path}")
+            path = generate_degradation_image(session, result, args.fuel_effect)
+            print(f"📈 Degradation chart saved to: {path}")
+        except Exception as e:
+            print(f"❌ Error generating degradation analysis: {e}")
+            sys.exit(1)
+
+    if args.cache_stats:
+        print(f"📦 {format_cache_stats()}")
+
 
 if __name__ == "__main__":
     main()
@@ -3,6 +3,7 @@ import seaborn as sns
 from fastf1 import plotting
 from fastf1.plotting import get_driver_color
 from logic.utils import make_data_filename
+from logic.compare import get_traces
 
 
 def print_best_laps(session, count: int = 5) -> None:
@@ -36,12 +37,14 @@ def generate_best_laps_image(session, count: int = 5) -> str:
 
     plt.style.use('dark_background')
 
+    drivers = list(laps['Driver'].unique()[:count])
+    traces = get_traces(session, drivers)
     fig, ax = plt.subplots(figsize=(14, 8))
-    for drv in laps['Driver'].unique()[:count]:
-        lap = laps.pick_drivers(drv).pick_fastest()
-        tel = lap.get_car_data().add_distance()
+    for drv in drivers:
+        if drv not in traces.traces:
+            continue
         color = get_driver_color(drv, session)
-        ax.plot(tel['Distance'], tel['Speed'], label=drv, linewidth=2, color=color)
+        ax.plot(traces.grid * traces.lengths[drv], traces.channel(drv, "Speed"), label=drv, linewidth=2, color=color)
 
     ax.legend(fontsize=14, framealpha=0.8, facecolor="#222", edgecolor="#444")
     ax.set_title(f"Top {count} Fastest Laps", fontsize=20, pad=15)
@@ -0,0 +1,244 @@
+import os
+import threading
+from collections import OrderedDict
+import matplotlib.pyplot as plt
+import numpy as np
+from fastf1 import plotting
+from fastf1.plotting import get_driver_color
+from logic.utils import make_data_filename
+
+
+GRID_POINTS = 2000
+CHANNELS = ("Time", "Speed", "Throttle", "Brake")
+MEMORY_SESSIONS = 8
+
+_memory = OrderedDict()
+_lock = threading.Lock()
+
+
+class TraceSet:
+    """
+    Fastest-lap traces of one session, resampled onto a common grid of lap
+    fraction so that any two drivers can be compared point by point.
+    """
+
+    def __init__(self):
+        self.grid = np.linspace(0.0, 1.0, GRID_POINTS)
+        self.lengths = {}
+        self.lap_times = {}
+        self.traces = {}
+
+    def distance(self, drivers: list) -> np.ndarray:
+        """
+        :param drivers: Drivers being compared.
+        :return: Grid in meters, scaled by the mean lap length of those drivers.
+        """
+        return self.grid * np.mean([self.lengths[drv] for drv in drivers])
+
+    def is_current(self, driver: str, lap_time: float) -> bool:
+        """
+        :param driver: Driver abbreviation.
+        :param lap_time: Current fastest lap time of the driver, seconds.
+        :return: True if the cached trace was built from that lap.
+        """
+        return driver in self.traces and np.isclose(self.lap_times.get(driver, np.nan), lap_time)
+
+    def add(self, driver: str, tel, lap_time: float) -> None:
+        """
+        Resample a lap's car data onto the grid.
+
+        :param driver: Driver abbreviation.
+        :param tel: Telemetry with Distance and the CHANNELS columns.
+        :param lap_time: Lap time of the lap, seconds, used to detect a stale trace.
+        """
+        dist = tel['Distance'].to_numpy(dtype=float)
+        length = dist[-1]
+        values = np.vstack([
+            tel['Time'].dt.total_seconds().to_numpy(),
+            tel['Speed'].to_numpy(dtype=float),
+            tel['Throttle'].to_numpy(dtype=float),
+            tel['Brake'].to_numpy(dtype=float),
+        ])
+        self.lengths[driver] = length
+        self.lap_times[driver] = lap_time
+        self.traces[driver] = np.vstack([np.interp(self.grid * length, dist, row) for row in values])
+
+    def remove(self, driver: str) -> bool:
+        """
+        :param driver: Driver abbreviation.
+        :return: True if the driver had a trace.
+        """
+        self.lengths.pop(driver, None)
+        self.lap_times.pop(driver, None)
+        return self.traces.pop(driver, None) is not None
+
+    def channel(self, driver: str, name: str) -> np.ndarray:
+        return self.traces[driver][CHANNELS.index(name)]
+
+    def save(self, filename: str) -> None:
+        drivers = sorted(self.traces)
+        tmp = filename + ".tmp.npz"
+        np.savez_compressed(
+            tmp,
+            drivers=np.array(drivers),
+            lengths=np.array([self.lengths[d] for d in drivers]),
+            lap_times=np.array([self.lap_times[d] for d in drivers]),
+            traces=np.stack([self.traces[d] for d in drivers]),
+        )
+        os.replace(tmp, filename)
+
+    @classmethod
+    def load(cls, filename: str):
+        traces = cls()
+        with np.load(filename) as data:
+            # Caches written without lap times are rebuilt on first use.
+            lap_times = data['lap_times'] if 'lap_times' in data.files else [np.nan] * len(data['drivers'])
+            for driver, length, lap_time, trace in zip(data['drivers'], data['lengths'], lap_times, data['traces']):
+                traces.lengths[str(driver)] = float(length)
+                traces.lap_times[str(driver)] = float(lap_time)
+                traces.traces[str(driver)] = trace
+        return traces
+
+
+def get_traces(session, drivers: list) -> TraceSet:
+    """
+    Return cached fastest-lap traces for the given drivers, reading raw
+    telemetry only for drivers not yet in the session's cache or whose
+    fastest lap changed since their trace was saved (e.g. after lap
+    times were corrected or deleted in the timing data).
+
+    :param session: A FastF1 session object.
+    :param drivers: Driver abbreviations.
+    :return: TraceSet containing every requested driver that has a fastest lap.
+    """
+    filename = make_data_filename("traces", session, "npz")
+    with _lock:
+        traces = _memory.get(filename)
+        if traces is None and os.path.exists(filename):
+            try:
+                traces = TraceSet.load(filename)
+            except Exception as e:
+                print(f"⚠ Failed to read trace cache {filename}: {e}.")
+        if traces is None:
+            traces = TraceSet()
+
+        updated = False
+        for drv in drivers:
+            lap = session.laps.pick_drivers(drv).pick_fastest()
+            if lap is None or lap.empty:
+                updated = traces.remove(drv) or updated
+                continue
+            lap_time = lap['LapTime'].total_seconds()
+            if traces.is_current(drv, lap_time):
+                continue
+            traces.add(drv, lap.get_car_data().add_distance(), lap_time)
+            updated = True
+        if updated and traces.traces:
+            traces.save(filename)
+
+        _memory[filename] = traces
+        _memory.move_to_end(filename)
+        while len(_memory) > MEMORY_SESSIONS:
+            _memory.popitem(last=False)
+    return traces
+
+
+def compare_drivers(session, drv1: str, drv2: str) -> dict:
+    """
+    Compare two drivers' fastest laps on the common distance grid.
+
+    :param session: A FastF1 session object.
+    :param drv1: Reference driver abbreviation.
+    :param drv2: Compared driver abbreviation.
+    :return: Dict of arrays: Distance, Speed1, Speed2, Delta (drv2 minus drv1, seconds),
+             SpeedDiff, ThrottleDiff and BrakeDiff (drv2 minus drv1), or None if a lap is missing.
+    """
+    traces = get_traces(session, [drv1, drv2])
+    for drv in (drv1, drv2):
+        if drv not in traces.traces:
+            print(f"⚠ No fastest lap available for driver {drv}.")
+            return None
+
+    speed1, speed2 = traces.channel(drv1, "Speed"), traces.channel(drv2, "Speed")
+    return {
+        "Distance": traces.distance([drv1, drv2]),
+        "Speed1": speed1,
+        "Speed2": speed2,
+        "Delta": traces.channel(drv2, "Time") - traces.channel(drv1, "Time"),
+        "SpeedDiff": speed2 - speed1,
+        "ThrottleDiff": traces.channel(drv2, "Throttle") - traces.channel(drv1, "Throttle"),
+        "BrakeDiff": traces.channel(drv2, "Brake") - traces.channel(drv1, "Brake"),
+    }
+
+
+def print_compare(session, drv1: str, drv2: str) -> None:
+    """
+    Print a short summary of the fastest-lap comparison.
+
+    :param session: A FastF1 session object.
+    :param drv1: Reference driver abbreviation.
+    :param drv2: Compared driver abbreviation.
+    """
+    cmp = compare_drivers(session, drv1, drv2)
+    if cmp is None:
+        return
+
+    print(f"\n🏁 {drv2} vs {drv1} (fastest laps):\n")
+    print(f"Lap delta: {cmp['Delta'][-1]:+.3f} s")
+    print(f"Max gain/loss: {cmp['Delta'].min():+.3f} / {cmp['Delta'].max():+.3f} s")
+    print(f"Top speed: {cmp['Speed1'].max():.0f} / {cmp['Speed2'].max():.0f} km/h")
+    print(f"Mean speed difference: {cmp['SpeedDiff'].mean():+.1f} km/h")
+
+
+def generate_compare_image(session, drv1: str, drv2: str) -> str:
+    """
+    Generate speed, time delta, throttle and brake comparison plots for two drivers.
+
+    :param session: A FastF1 session object.
+    :param drv1: Reference driver abbreviation.
+    :param drv2: Compared driver abbreviation.
+    :return: Path to the saved image.
+    """
+    cmp = compare_drivers(session, drv1, drv2)
+    if cmp is None:
+        return None
+
+    plt.style.use('dark_background')
+    plotting.setup_mpl(misc_mpl_mods=False, color_scheme='fastf1')
+
+    color1 = get_driver_color(drv1, session)
+    color2 = get_driver_color(drv2, session)
+    if color1 == color2:
+        color2 = 'white'
+    dist = cmp['Distance']
+    fig, axes = plt.subplots(4, 1, figsize=(14, 12), sharex=True,
+                             gridspec_kw={'height_ratios': [3, 2, 1.5, 1]})
+
+    axes[0].plot(dist, cmp['Speed1'], color=color1, label=drv1, linewidth=2)
+    axes[0].plot(dist, cmp['Speed2'], color=color2, label=drv2, linewidth=2)
+    axes[0].set_ylabel("Speed, km/h", fontsize=14)
+    axes[0].legend(fontsize=14, framealpha=0.8, facecolor="#222", edgecolor="#444")
+
+    axes[1].plot(dist, cmp['Delta'], color=color2, linewidth=2)
+    axes[1].axhline(0, color=color1, linewidth=1, alpha=0.7)
+    axes[1].set_ylabel(f"Delta to {drv1}, s", fontsize=14)
+
+    axes[2].plot(dist, cmp['ThrottleDiff'], color=color2, linewidth=1.5)
+    axes[2].axhline(0, color=color1, linewidth=1, alpha=0.7)
+    axes[2].set_ylabel("Throttle diff, %", fontsize=14)
+
+    axes[3].fill_between(dist, cmp['BrakeDiff'], 0, color=color2, alpha=0.7, step='mid')
+    axes[3].axhline(0, color=color1, linewidth=1, alpha=0.7)
+    axes[3].set_ylabel("Brake diff", fontsize=14)
+    axes[3].set_xlabel("Distance, meters", fontsize=16)
+
+    for ax in axes:
+        ax.tick_params(axis='both', which='major', labelsize=12)
+        ax.grid(True, alpha=0.3, linestyle='--')
+    axes[0].set_title(f"{drv2} vs {drv1} Fastest Laps ({cmp['Delta'][-1]:+.3f} s)", fontsize=20, pad=15)
+    plt.tight_layout()
+
+    filename = make_data_filename(f"compare_{drv1}_{drv2}", session)
+    fig.savefig(filename, bbox_inches='tight', dpi=180)
+    plt.close(fig)
+    return filename
@@ -0,0 +1,162 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from fastf1 import plotting
+from fastf1.plotting import get_compound_color
+from logic.utils import make_data_filename
+from logic.table_renderer import table_digest, is_cached, render_table
+
+
+def fit_stints(x: np.ndarray, y: np.ndarray, codes: np.ndarray, n_groups: int, mask: np.ndarray):
+    """
+    Least-squares line fit of y over x for every group at once.
+
+    :param x: Tyre age per lap.
+    :param y: Lap time per lap, seconds.
+    :param codes: Group index per lap.
+    :param n_groups: Number of groups.
+    :param mask: Boolean array of laps to include.
+    :return: Tuple of (slope, intercept, count) arrays indexed by group.
+    """
+    w = mask.astype(float)
+    n = np.bincount(codes, weights=w, minlength=n_groups)
+    sx = np.bincount(codes, weights=w * x, minlength=n_groups)
+    sy = np.bincount(codes, weights=w * y, minlength=n_groups)
+    sxx = np.bincount(codes, weights=w * x * x, minlength=n_groups)
+    sxy = np.bincount(codes, weights=w * x * y, minlength=n_groups)
+    denom = n * sxx - sx * sx
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(denom > 0, (n * sxy - sx * sy) / denom, np.nan)
+        intercept = (sy - slope * sx) / n
+    return slope, intercept, n
+
+
+def compute_degradation(session, fuel_effect: float = 0.0, outlier_threshold: float = 3.0,
+                        min_laps: int = 4) -> pd.DataFrame:
+    """
+    Fit a lap-time trend over tyre age for every driver stint in one pass.
+
+    :param session: A FastF1 session object.
+    :param fuel_effect: Lap time gained per lap from fuel burn, seconds. Added back per lap number
+                        for the trend fit only; Pace is the mean of the measured lap times.
+    :param outlier_threshold: Laps further than this many robust deviations from the first fit are dropped.
+    :param min_laps: Minimum number of laps for a stint to be ranked.
+    :return: DataFrame with Driver, Stint, Compound, Laps, Degradation (s/lap) and Pace, ranked by Degradation.
+    """
+    laps = session.laps.pick_quicklaps()
+    laps = laps[laps['TyreLife'].notna() & laps['Stint'].notna()]
+    if laps.empty:
+        return pd.DataFrame(columns=['Driver', 'Stint', 'Compound', 'Laps', 'Degradation', 'Pace'])
+
+    keys = laps[['Driver', 'Stint', 'Compound']].fillna({'Compound': 'UNKNOWN'})
+    codes, groups = pd.MultiIndex.from_frame(keys).factorize()
+    n_groups = len(groups)
+    x = laps['TyreLife'].to_numpy(dtype=float)
+    raw = laps['LapTime'].dt.total_seconds().to_numpy()
+    y = raw + fuel_effect * laps['LapNumber'].to_numpy(dtype=float)
+
+    mask = np.ones(len(x), dtype=bool)
+    slope, intercept, n = fit_stints(x, y, codes, n_groups, mask)
+    if outlier_threshold:
+        resid = y - (intercept[codes] + slope[codes] * x)
+        abs_resid = np.abs(resid)
+        mad = pd.Series(abs_resid).groupby(codes).transform('median').to_numpy()
+        scale = np.maximum(1.4826 * mad, 1e-3)
+        mask = ~(abs_resid > outlier_threshold * scale)
+        slope, intercept, n = fit_stints(x, y, codes, n_groups, mask)
+
+    pace = np.bincount(codes, weights=mask * raw, minlength=n_groups) / np.maximum(n, 1)
+    # factorize() drops the level names of the MultiIndex.
+    result = groups.to_frame(index=False, name=['Driver', 'Stint', 'Compound'])
+    result['Stint'] = result['Stint'].astype(int)
+    result['Laps'] = n.astype(int)
+    result['Degradation'] = slope
+    result['Pace'] = pace
+    result = result[(result['Laps'] >= min_laps) & result['Degradation'].notna()]
+    return result.sort_values('Degradation', kind='stable').reset_index(drop=True)
+
+
+def print_degradation(result: pd.DataFrame) -> None:
+    """
+    Print stints ranked by tyre degradation rate.
+
+    :param result: Result of compute_degradation().
+    """
+    if result.empty:
+        print("⚠ No stints long enough to estimate degradation.")
+        return
+
+    print("\n🏁 Tyre Degradation (s/lap):\n")
+    print(result.round({'Degradation': 3, 'Pace': 3}).to_string(index=False))
+
+
+def generate_degradation_table_image(session, result: pd.DataFrame) -> str:
+    """
+    Generate an image of the degradation ranking in table format.
+
+    :param session: A FastF1 session object.
+    :param result: Result of compute_degradation().
+    :return: Path to the saved image.
+    """
+    if result.empty:
+        print("⚠ No stints long enough to estimate degradation.")
+        return None
+
+    col_labels = ['#', 'Driver', 'Stint', 'Compound', 'Laps', 'Deg, s/lap', 'Pace, s']
+    data = [
+        [str(i + 1), drv, str(stint), comp, str(laps), f"{deg:+.3f}", f"{pace:.3f}"]
+        for i, (drv, stint, comp, laps, deg, pace) in enumerate(zip(
+            result['Driver'], result['Stint'], result['Compound'],
+            result['Laps'], result['Degradation'], result['Pace']
+        ))
+    ]
+    filename = make_data_filename("degradation_table", session)
+    digest = table_digest(col_labels, data)
+    if is_cached(filename, digest):
+        return filename
+    return render_table(col_labels, data, filename, digest)
+
+
+def generate_degradation_image(session, result: pd.DataFrame, fuel_effect: float = 0.0) -> str:
+    """
+    Generate a bar chart of degradation rate per driver stint, colored by compound.
+
+    :param session: A FastF1 session object.
+    :param result: Result of compute_degradation().
+    :param fuel_effect: Fuel correction used for the result, shown in the title.
+    :return: Path to the saved image.
+    """
+    if result.empty:
+        print("⚠ No stints long enough to estimate degradation.")
+        return None
+
+    plt.style.use('dark_background')
+    plotting.setup_mpl(misc_mpl_mods=False, color_scheme='fastf1')
+
+    labels = result['Driver'] + " S" + result['Stint'].astype(str)
+    colors = [get_compound_color(comp, session) for comp in result['Compound']]
+    fig, ax = plt.subplots(figsize=(14, len(result) * 0.4 + 2))
+    ax.barh(labels, result['Degradation'], color=colors, edgecolor="#333", height=0.7)
+
+    compounds = result['Compound'].unique()
+    legend_handles = [
+        plt.Rectangle((0, 0), 1, 1, color=get_compound_color(comp, session), label=comp)
+        for comp in compounds
+    ]
+    ax.legend(handles=legend_handles, title="Compound", bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=14)
+    ax.invert_yaxis()
+    ax.axvline(0, color='white', linewidth=1, alpha=0.5)
+    ax.set_xlabel("Degradation, s/lap", fontsize=16)
+    ax.set_ylabel("Driver stint", fontsize=16)
+    title = "Tyre Degradation by Stint"
+    if fuel_effect:
+        title += f" (fuel corrected, {fuel_effect:.3f} s/lap)"
+    ax.set_title(title, fontsize=20, pad=15)
+    ax.tick_params(axis='both', which='major', labelsize=13)
+    ax.grid(True, axis='x', alpha=0.3, linestyle='--')
+    plt.tight_layout()
+
+    filename = make_data_filename("degradation", session)
+    fig.savefig(filename, bbox_inches='tight', dpi=180)
+    plt.close(fig)
+    return filename
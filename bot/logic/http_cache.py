@@ -0,0 +1,205 @@
+import importlib
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import fastf1
+from requests.adapters import HTTPAdapter
+# fastf1.api warns on import since FastF1 3.8; older releases only have it.
+try:
+    from fastf1 import _api as api
+except ImportError:
+    from fastf1 import api
+
+
+CACHE_DIR = os.getenv("FASTF1_CACHE_DIR", os.path.expanduser("~/.cache/fastf1"))
+HTTP_POOL_SIZE = int(os.getenv("FASTF1_HTTP_POOL_SIZE", "16"))
+PREFETCH_WORKERS = int(os.getenv("FASTF1_PREFETCH_WORKERS", "6"))
+LIVETIMING_URL = os.getenv("FASTF1_LIVETIMING_URL")
+ERGAST_URL = os.getenv("FASTF1_ERGAST_URL")
+# fastf1.get_session() looks the event up in a schedule fetched from the
+# FastF1 GitHub mirror by default. With Ergast redirected to a stand-in
+# server the schedule is read from Ergast too, so no request bypasses it.
+SCHEDULE_BACKEND = os.getenv("FASTF1_SCHEDULE_BACKEND") or ("ergast" if ERGAST_URL else None)
+
+HTTP_CACHE_FILE = "fastf1_http_cache.sqlite"
+
+# Independent livetiming endpoints fetched by session.load(). Each call is
+# cached on disk by FastF1, so fetching them concurrently warms the cache
+# and the following session.load() only reads local files.
+PREFETCH_ENDPOINTS = (
+    api.driver_info,
+    api.session_status_data,
+    api.track_status_data,
+    api.race_control_messages,
+    api.weather_data,
+    api.timing_app_data,
+    api.timing_data,
+    api.car_data,
+    api.position_data,
+)
+
+
+class TransportStats:
+    """
+    Thread-safe counters for HTTP responses seen by the FastF1 sessions.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.fetched_bytes = 0
+
+    def record(self, response, *args, **kwargs):
+        # requests-cache dispatches response hooks a second time after
+        # requests.Session.send() has already run them for a miss.
+        if getattr(response, "_ff1_counted", False):
+            return response
+        response._ff1_counted = True
+        from_cache = getattr(response, "from_cache", False)
+        size = 0 if from_cache else len(response.content or b"")
+        with self._lock:
+            if from_cache:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.fetched_bytes += size
+        return response
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "requests": total,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "fetched_bytes": self.fetched_bytes,
+            }
+
+
+stats = TransportStats()
+_initialized = False
+_init_lock = threading.Lock()
+
+
+def enable_wal(db_path: str) -> None:
+    """
+    Switch a SQLite database to WAL mode so several processes can read the
+    HTTP cache while one of them writes. The mode is stored in the file itself.
+
+    :param db_path: Path to the SQLite file.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+    finally:
+        conn.close()
+
+
+def configure_session(session) -> None:
+    """
+    Mount a pooled keep-alive adapter and the stats hook on a requests session.
+
+    :param session: A requests (or requests-cache) session.
+    """
+    if session is None:
+        return
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if stats.record not in session.hooks["response"]:
+        session.hooks["response"].append(stats.record)
+
+
+def init_cache(cache_dir: str = None) -> str:
+    """
+    Enable the FastF1 on-disk and HTTP caches in a shared directory and
+    configure pooled connections. Safe to call more than once.
+
+    :param cache_dir: Cache directory, defaults to FASTF1_CACHE_DIR.
+    :return: The cache directory in use.
+    """
+    global _initialized
+    cache_dir = cache_dir or CACHE_DIR
+    with _init_lock:
+        if _initialized:
+            return cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        if LIVETIMING_URL:
+            for name in ("fastf1.api", "fastf1._api"):
+                try:
+                    importlib.import_module(name).base_url = LIVETIMING_URL.rstrip("/")
+                except ImportError:
+                    pass
+        if ERGAST_URL:
+            from fastf1.ergast import interface
+            interface.BASE_URL = ERGAST_URL.rstrip("/")
+        fastf1.Cache.enable_cache(cache_dir)
+        enable_wal(os.path.join(cache_dir, HTTP_CACHE_FILE))
+        configure_session(getattr(fastf1.Cache, "_requests_session_cached", None))
+        configure_session(getattr(fastf1.Cache, "_requests_session", None))
+        _initialized = True
+    return cache_dir
+
+
+def get_session(year: int, gp, sess_type: str):
+    """
+    fastf1.get_session() using the configured schedule backend.
+
+    :param year: Season year.
+    :param gp: Grand Prix name or round number.
+    :param sess_type: Session type.
+    :return: A FastF1 session object (not loaded).
+    """
+    return fastf1.get_session(year, gp, sess_type, backend=SCHEDULE_BACKEND)
+
+
+def get_event_schedule(year: int, **kwargs):
+    """
+    fastf1.get_event_schedule() using the configured schedule backend.
+
+    :param year: Season year.
+    :return: The season's EventSchedule.
+    """
+    return fastf1.get_event_schedule(year, backend=SCHEDULE_BACKEND, **kwargs)
+
+
+def prefetch_session(session, workers: int = PREFETCH_WORKERS) -> None:
+    """
+    Fetch the independent livetiming endpoints of a session concurrently.
+    Failures are ignored here; session.load() reports them as usual.
+
+    :param session: A FastF1 session object (not yet loaded).
+    :param workers: Number of parallel requests.
+    """
+    path = getattr(session, "api_path", None)
+    if not path or workers < 2:
+        return
+
+    def fetch(func):
+        try:
+            func(path)
+        except Exception:
+            pass
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(fetch, PREFETCH_ENDPOINTS))
+
+
+def format_cache_stats() -> str:
+    """
+    Format the current cache statistics for display.
+
+    :return: Human-readable summary.
+    """
+    s = stats.snapshot()
+    return (
+        f"HTTP requests: {s['requests']}, cache hits: {s['hits']} "
+        f"({s['hit_rate']:.0%}), fetched: {s['fetched_bytes'] / 1024 / 1024:.1f} MB"
+    )
@@ -0,0 +1,394 @@
+import ast
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+import pandas as pd
+from PIL import Image
+from logic.position_changes import plot_position_changes
+from logic.strategy import plot_strategy
+from logic.utils import make_live_filename
+
+
+LIVE_DIR = os.path.join("data", "live")
+LIVE_UPDATE_INTERVAL = float(os.getenv("LIVE_UPDATE_INTERVAL", "20"))
+LIVE_TIMEOUT = int(os.getenv("LIVE_TIMEOUT", "120"))
+# Messages handled between yields to the event loop, and lines parsed per
+# worker-thread batch when replaying, so a long feed never blocks the bot.
+YIELD_EVERY = 100
+REPLAY_BATCH = 500
+
+COMPOUND_COLORS = {
+    "SOFT": "#da291c",
+    "MEDIUM": "#ffd12e",
+    "HARD": "#f0f0ec",
+    "INTERMEDIATE": "#43b02a",
+    "WET": "#0067ad",
+    "UNKNOWN": "#00ffff",
+    "TEST_UNKNOWN": "#434649",
+}
+
+
+def parse_line(line: str) -> list:
+    """
+    Parse one line of a FastF1 livetiming recording.
+
+    Regular lines hold a single [category, data, timestamp] message. The
+    initial state sent on connect is a {"R": {category: data}} dict and is
+    expanded into one message per category.
+
+    :param line: Raw line from the recording.
+    :return: List of (category, data, timestamp) tuples.
+    """
+    line = line.strip()
+    if not line or line[0] not in "[{":
+        return []
+    try:
+        msg = ast.literal_eval(line)
+    except (ValueError, SyntaxError):
+        try:
+            msg = json.loads(line)
+        except json.JSONDecodeError:
+            return []
+    if isinstance(msg, dict):
+        return [(cat, data, None) for cat, data in msg.get("R", {}).items() if isinstance(data, dict)]
+    if isinstance(msg, list) and len(msg) >= 2 and isinstance(msg[1], dict):
+        return [(msg[0], msg[1], msg[2] if len(msg) > 2 else None)]
+    return []
+
+
+def as_int(value) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return None
+
+
+def parse_timestamp(value) -> float:
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class LiveState:
+    """
+    Lap, position and stint structures built incrementally from livetiming
+    messages. Drivers are keyed by racing number until DriverList arrives.
+    """
+
+    def __init__(self):
+        self.drivers = {}
+        self.colors = {}
+        self.laps = {}
+        self.positions = {}
+        self.position_rows = []
+        self.stints = {}
+        self.dirty = set()
+        self.messages = 0
+
+    def apply(self, category: str, data: dict) -> None:
+        """
+        Update the state with one message and mark the affected charts dirty.
+
+        :param category: Livetiming topic, e.g. "TimingData".
+        :param data: Message payload.
+        """
+        self.messages += 1
+        if category == "DriverList":
+            self.apply_driver_list(data)
+        elif category == "TimingData":
+            self.apply_timing_data(data)
+        elif category == "TimingAppData":
+            self.apply_timing_app_data(data)
+
+    def apply_driver_list(self, data: dict) -> None:
+        for num, info in data.items():
+            if not isinstance(info, dict):
+                continue
+            if info.get("Tla"):
+                self.drivers[num] = info["Tla"]
+                self.dirty.update(("position", "strategy"))
+            if info.get("TeamColour"):
+                self.colors[num] = f"#{info['TeamColour']}"
+                self.dirty.add("position")
+
+    def apply_timing_data(self, data: dict) -> None:
+        for num, line in data.get("Lines", {}).items():
+            if not isinstance(line, dict):
+                continue
+            if str(line.get("Position", "")).isdigit():
+                self.positions[num] = int(line["Position"])
+            lap = line.get("NumberOfLaps")
+            if isinstance(lap, int) and lap > self.laps.get(num, 0):
+                self.laps[num] = lap
+                if num in self.positions:
+                    self.position_rows.append((num, lap, self.positions[num]))
+                    self.dirty.add("position")
+                if self.stints.get(num):
+                    self.dirty.add("strategy")
+
+    def apply_timing_app_data(self, data: dict) -> None:
+        for num, line in data.get("Lines", {}).items():
+            if not isinstance(line, dict) or "Stints" not in line:
+                continue
+            stints = line["Stints"]
+            if isinstance(stints, list):
+                stints = dict(enumerate(stints))
+            driver_stints = self.stints.setdefault(num, {})
+            for idx, stint in stints.items():
+                if not isinstance(stint, dict):
+                    continue
+                idx = int(idx)
+                if idx not in driver_stints:
+                    driver_stints[idx] = {"Compound": "UNKNOWN", "ArrivalLap": self.laps.get(num, 0) + 1}
+                    self.dirty.add("strategy")
+                current = driver_stints[idx]
+                compound = stint.get("Compound")
+                if compound and compound != current["Compound"]:
+                    current["Compound"] = compound
+                    self.dirty.add("strategy")
+                for key in ("StartLaps", "TotalLaps"):
+                    value = as_int(stint.get(key))
+                    if value is not None and value != current.get(key):
+                        current[key] = value
+                        self.dirty.add("strategy")
+
+    def driver_name(self, num: str) -> str:
+        return self.drivers.get(num, num)
+
+    def position_frame(self) -> pd.DataFrame:
+        """
+        :return: DataFrame with Driver, LapNumber and Position columns.
+        """
+        laps = pd.DataFrame(self.position_rows, columns=["Driver", "LapNumber", "Position"])
+        laps["Driver"] = laps["Driver"].map(self.driver_name)
+        return laps
+
+    def stint_frame(self) -> pd.DataFrame:
+        """
+        :return: DataFrame in the format of strategy.build_stint_info().
+        """
+        rows = []
+        for num, stints in self.stints.items():
+            indices = sorted(stints)
+            prev_end = 0
+            for i, idx in enumerate(indices):
+                stint = stints[idx]
+                start = prev_end + 1
+                if "StartLaps" in stint and "TotalLaps" in stint:
+                    # Laps on this set of tyres within the stint, sent by the feed itself.
+                    end = start + stint["TotalLaps"] - stint["StartLaps"] - 1
+                elif i + 1 < len(indices):
+                    end = stints[indices[i + 1]]["ArrivalLap"] - 1
+                else:
+                    end = self.laps.get(num, 0)
+                prev_end = max(prev_end, end)
+                if end < start:
+                    continue
+                rows.append((self.driver_name(num), idx + 1, stints[idx]["Compound"], start, end, end - start + 1))
+        return pd.DataFrame(rows, columns=["Driver", "Stint", "Compound", "StartLap", "EndLap", "StintLength"])
+
+
+def stack_images(paths: list, filename: str) -> str:
+    """
+    Stack images vertically into one file.
+
+    :param paths: Source image paths.
+    :param filename: Destination path.
+    :return: Path to the saved image.
+    """
+    images = [Image.open(p) for p in paths]
+    width = max(img.width for img in images)
+    out = Image.new("RGB", (width, sum(img.height for img in images)), "black")
+    top = 0
+    for img in images:
+        out.paste(img, ((width - img.width) // 2, top))
+        top += img.height
+        img.close()
+    out.save(filename)
+    return filename
+
+
+class LiveCharts:
+    """
+    Renders the live charts, redrawing only those whose data changed.
+    """
+
+    def __init__(self, feed: str):
+        self.feed = feed
+        self.paths = {}
+
+    def render(self, state: LiveState) -> str:
+        """
+        Redraw dirty charts and combine all charts into one image.
+
+        :param state: Live state; its dirty flags are cleared.
+        :return: Path to the combined image, or None if nothing changed.
+        """
+        dirty, state.dirty = state.dirty, set()
+        changed = False
+        if "position" in dirty and state.position_rows:
+            laps = state.position_frame()
+            colors = {state.driver_name(num): color for num, color in state.colors.items()}
+            self.paths["position"] = plot_position_changes(
+                laps, colors, make_live_filename("position_changes", self.feed)
+            )
+            changed = True
+        if "strategy" in dirty:
+            stint_info = state.stint_frame()
+            if not stint_info.empty:
+                self.paths["strategy"] = plot_strategy(
+                    stint_info, lambda compound: COMPOUND_COLORS.get(compound, COMPOUND_COLORS["UNKNOWN"]),
+                    make_live_filename("strategy", self.feed)
+                )
+                changed = True
+        if not changed:
+            return None
+        paths = [self.paths[key] for key in ("position", "strategy") if key in self.paths]
+        return stack_images(paths, make_live_filename("live_charts", self.feed))
+
+
+def read_batch(f, size: int) -> tuple:
+    """
+    Read and parse up to `size` lines of an open recording.
+
+    :param f: Open recording file.
+    :param size: Maximum number of lines.
+    :return: Tuple of (messages, reached end of file).
+    """
+    messages = []
+    for _ in range(size):
+        line = f.readline()
+        if not line:
+            return messages, True
+        messages.extend(parse_line(line))
+    return messages, False
+
+
+async def replay_recording(path: str, speed: float = None):
+    """
+    Replay a saved recording, optionally paced by its message timestamps.
+
+    :param path: Recording file.
+    :param speed: Playback speed multiplier, None to replay without delays.
+    """
+    prev = None
+    with open(path, encoding="utf-8") as f:
+        while True:
+            batch, eof = await asyncio.to_thread(read_batch, f, REPLAY_BATCH)
+            for category, data, timestamp in batch:
+                ts = parse_timestamp(timestamp) if speed and timestamp else None
+                if ts is not None and prev is not None and ts > prev:
+                    await asyncio.sleep((ts - prev) / speed)
+                prev = ts if ts is not None else prev
+                yield category, data, timestamp
+            if eof:
+                return
+
+
+async def follow_recording(path: str, done: asyncio.Event, poll: float = 1.0):
+    """
+    Tail a recording while it is being written.
+
+    :param path: Recording file.
+    :param done: Set when the writer has finished.
+    :param poll: Delay between reads when no new data is available.
+    """
+    while not os.path.exists(path):
+        if done.is_set():
+            return
+        await asyncio.sleep(poll)
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        while True:
+            chunk = f.readline()
+            if chunk:
+                buffer += chunk
+                if buffer.endswith("\n"):
+                    for msg in parse_line(buffer):
+                        yield msg
+                    buffer = ""
+                continue
+            if done.is_set():
+                return
+            await asyncio.sleep(poll)
+
+
+async def stream_live(path: str, timeout: int = LIVE_TIMEOUT):
+    """
+    Record the current live session with FastF1's SignalR client and yield
+    its messages as they arrive. The client runs in a subprocess, so closing
+    the generator terminates it and waits for it to exit.
+
+    :param path: Recording file to write.
+    :param timeout: Seconds without data after which the client stops.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    recorder = await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "fastf1.livetiming", "save", "--timeout", str(timeout), path
+    )
+    done = asyncio.Event()
+    watcher = asyncio.create_task(recorder.wait())
+    watcher.add_done_callback(lambda _: done.set())
+    try:
+        async for msg in follow_recording(path, done):
+            yield msg
+    finally:
+        await stop_process(recorder)
+
+
+async def stop_process(proc, grace: float = 10.0) -> None:
+    """
+    Terminate a subprocess and wait for it, killing it if it does not exit in time.
+
+    :param proc: asyncio subprocess.
+    :param grace: Seconds to wait after SIGTERM.
+    """
+    if proc.returncode is None:
+        proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), grace)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+
+
+async def run_feed(messages, feed: str, on_update, interval: float = LIVE_UPDATE_INTERVAL) -> LiveState:
+    """
+    Consume livetiming messages and publish re-rendered charts at most once
+    per interval, plus a final update when the feed ends. Charts are drawn
+    on the event loop thread like every other pyplot chart of the bot,
+    since pyplot's current figure and style are process-global.
+
+    :param messages: Async iterator of (category, data, timestamp) tuples.
+    :param feed: Name used for the output files.
+    :param on_update: Async callable receiving the combined image path.
+    :param interval: Minimum seconds between updates.
+    :return: The final live state.
+    """
+    state = LiveState()
+    charts = LiveCharts(feed)
+    last = 0.0
+    try:
+        async for category, data, _ in messages:
+            state.apply(category, data)
+            if state.messages % YIELD_EVERY == 0:
+                await asyncio.sleep(0)
+            if state.dirty and time.monotonic() - last >= interval:
+                path = charts.render(state)
+                if path:
+                    await on_update(path)
+                    last = time.monotonic()
+    finally:
+        # On cancellation, close the source now so a live recorder is stopped
+        # before the task finishes rather than whenever the generator is collected.
+        if hasattr(messages, "aclose"):
+            await messages.aclose()
+    path = charts.render(state)
+    if path:
+        await on_update(path)
+    return state
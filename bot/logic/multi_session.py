@@ -0,0 +1,203 @@
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib.pyplot as plt
+import pandas as pd
+from fastf1 import plotting
+from logic.http_cache import get_event_schedule
+from logic.multi_session_worker import METRICS, logger_levels, init_worker, load_summary
+from logic.utils import make_multi_filename
+
+
+MULTI_SESSION_WORKERS = int(os.getenv("MULTI_SESSION_WORKERS", "4"))
+MAX_SESSIONS = int(os.getenv("MULTI_SESSION_MAX", "30"))
+CHART_DRIVERS = 5
+
+METRIC_LABELS = {
+    "fastest": "Fastest Lap",
+    "pace": "Race Pace (median quick lap)",
+    "results": "Finishing Position",
+}
+
+LAST_RE = re.compile(r"^last(\d+)$", re.IGNORECASE)
+
+
+def parse_years(spec: str) -> list:
+    """
+    Parse "2024", "2022-2024" or "2022,2024" into a list of years.
+
+    :param spec: Year specification.
+    :return: List of years.
+    """
+    years = []
+    for part in str(spec).split(","):
+        if "-" in part:
+            start, end = (int(p) for p in part.split("-", 1))
+            years.extend(range(start, end + 1))
+        elif part.strip():
+            years.append(int(part))
+    return years
+
+
+def resolve_events(years: list, gps: str) -> list:
+    """
+    Expand a GP specification into (year, gp) pairs in chronological order.
+
+    :param years: Season years.
+    :param gps: Comma-separated GP names, or "lastN" for the N most recent events of those seasons.
+    :return: List of (year, gp) tuples.
+    """
+    match = LAST_RE.match(gps.strip())
+    if not match:
+        names = [gp.strip() for gp in gps.split(",") if gp.strip()]
+        events = [(year, gp) for year in years for gp in names]
+    else:
+        now = pd.Timestamp.now()
+        events = []
+        for year in years:
+            schedule = get_event_schedule(year, include_testing=False)
+            past = schedule[schedule['EventDate'] < now]
+            events.extend((year, int(rnd)) for rnd in past['RoundNumber'])
+        events = events[-int(match.group(1)):]
+    if len(events) > MAX_SESSIONS:
+        raise ValueError(f"Too many sessions requested: {len(events)} > {MAX_SESSIONS}")
+    return events
+
+
+def iter_session_summaries(events: list, sess_type: str, metric: str, workers: int = MULTI_SESSION_WORKERS):
+    """
+    Load sessions concurrently in a process pool and yield their summaries
+    as they complete. Each worker process handles one session and exits,
+    so at most `workers` sessions are in memory at a time.
+
+    The worker entry point lives in logic.multi_session_worker so that
+    unpickling it imports only the loading code. Spawned workers still
+    re-import the parent's __main__ module (cli.py or telegram.py, run as
+    __mp_main__) once per session; that start-up cost is accepted in
+    exchange for fresh processes that return all memory after each
+    session, and both scripts keep their entry point under
+    `if __name__ == "__main__"` so nothing is started twice.
+
+    :param events: List of (year, gp) tuples.
+    :param sess_type: Session type.
+    :param metric: One of METRICS.
+    :param workers: Number of worker processes.
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric: {metric}")
+    tasks = [(i, year, gp, sess_type, metric) for i, (year, gp) in enumerate(events)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(1, min(workers, len(tasks))), mp_context=context,
+                             max_tasks_per_child=1, initializer=init_worker,
+                             initargs=(logger_levels(),)) as pool:
+        futures = [pool.submit(load_summary, task) for task in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def compare_sessions(years: list, gps: str, sess_type: str, metric: str,
+                     workers: int = MULTI_SESSION_WORKERS) -> list:
+    """
+    Summarize several sessions for a cross-event comparison.
+
+    :param years: Season years.
+    :param gps: GP specification, see resolve_events().
+    :param sess_type: Session type.
+    :param metric: One of METRICS.
+    :param workers: Number of worker processes.
+    :return: List of summaries in chronological order.
+    """
+    events = resolve_events(years, gps)
+    summaries = list(iter_session_summaries(events, sess_type, metric, workers))
+    return sorted(summaries, key=lambda s: s["index"])
+
+
+def summary_frame(summaries: list, drivers: list = None) -> pd.DataFrame:
+    """
+    Arrange summaries as a table with one row per session and one column per driver.
+
+    :param summaries: Result of compare_sessions().
+    :param drivers: Drivers to keep, or None for all.
+    :return: DataFrame indexed by session label.
+    """
+    rows = {s["label"]: s["values"] for s in summaries if "values" in s}
+    df = pd.DataFrame.from_dict(rows, orient="index")
+    if drivers:
+        df = df.reindex(columns=drivers)
+    return df
+
+
+def print_multi_session(summaries: list, metric: str, drivers: list = None) -> None:
+    """
+    Print the cross-session comparison table.
+
+    :param summaries: Result of compare_sessions().
+    :param metric: One of METRICS.
+    :param drivers: Drivers to show, or None for all.
+    """
+    for s in summaries:
+        if "error" in s:
+            print(f"⚠ {s['label']}: {s['error']}")
+    df = summary_frame(summaries, drivers)
+    if df.empty:
+        print("⚠ No session data available.")
+        return
+
+    print(f"\n🏁 {METRIC_LABELS[metric]}:\n")
+    print(df.round(3).to_string())
+
+
+def generate_multi_session_image(summaries: list, metric: str, query: str, drivers: list = None) -> str:
+    """
+    Generate one chart comparing drivers across sessions.
+
+    Lap-time metrics are shown as the gap to the best driver of each session,
+    so that different circuits can share an axis.
+
+    :param summaries: Result of compare_sessions().
+    :param metric: One of METRICS.
+    :param query: Description of the compared sessions, used in the file name.
+    :param drivers: Drivers to plot, or None for the best drivers on average.
+    :return: Path to the saved image.
+    """
+    df = summary_frame(summaries)
+    if df.empty:
+        print("⚠ No session data available.")
+        return None
+
+    if metric != "results":
+        df = (df.div(df.min(axis=1), axis=0) - 1) * 100
+    if drivers:
+        df = df.reindex(columns=drivers)
+    else:
+        df = df[df.mean().nsmallest(CHART_DRIVERS).index]
+
+    plt.style.use('dark_background')
+    plotting.setup_mpl(misc_mpl_mods=False, color_scheme='fastf1')
+
+    colors = {}
+    for s in summaries:
+        colors.update(s.get("colors", {}))
+    fig, ax = plt.subplots(figsize=(14, 8))
+    x = range(len(df.index))
+    for drv in df.columns:
+        ax.plot(x, df[drv], marker='o', linewidth=2, markersize=8, label=drv, color=colors.get(drv))
+
+    ax.set_xticks(list(x))
+    ax.set_xticklabels(df.index, rotation=30, ha='right', fontsize=13)
+    ax.legend(bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=14, framealpha=0.8)
+    if metric == "results":
+        ax.invert_yaxis()
+        ax.set_ylabel("Position", fontsize=16)
+    else:
+        ax.set_ylabel("Gap to session best, %", fontsize=16)
+    ax.set_title(f"{METRIC_LABELS[metric]} Across Sessions", fontsize=20, pad=15)
+    ax.tick_params(axis='y', which='major', labelsize=13)
+    ax.grid(True, alpha=0.3, linestyle='--')
+    plt.tight_layout()
+
+    filename = make_multi_filename(f"multi_{metric}", query)
+    fig.savefig(filename, bbox_inches='tight', dpi=180)
+    plt.close(fig)
+    return filename
@@ -0,0 +1,82 @@
+import logging
+import pandas as pd
+from logic.http_cache import init_cache, get_session
+from logic.storage import touch_event
+from logic.utils import safe_name
+
+
+LOGGERS = ("fastf1", "fastf1.req", "fastf1.core")
+
+# Only the data a metric needs is loaded in the workers.
+PROFILES = {
+    "results": dict(laps=False, telemetry=False, weather=False, messages=False),
+    "laps": dict(laps=True, telemetry=False, weather=False, messages=False),
+}
+METRICS = {
+    "fastest": "laps",
+    "pace": "laps",
+    "results": "results",
+}
+
+
+def logger_levels() -> dict:
+    """
+    :return: Mapping of FastF1 logger name to its level in this process.
+    """
+    return {name: logging.getLogger(name).level for name in LOGGERS}
+
+
+def init_worker(levels: dict) -> None:
+    """
+    Process pool initializer. Spawned workers start with default logging,
+    so the parent's FastF1 logger levels are applied again here.
+
+    :param levels: Result of logger_levels() in the parent process.
+    """
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def summarize(session, metric: str) -> dict:
+    """
+    Reduce a loaded session to one value per driver.
+
+    :param session: A loaded FastF1 session object.
+    :param metric: One of METRICS.
+    :return: Mapping of driver abbreviation to value (lower is better).
+    """
+    if metric == "results":
+        results = session.results
+        values = pd.to_numeric(results['Position'], errors='coerce')
+        values.index = results['Abbreviation']
+    else:
+        laps = session.laps.pick_quicklaps()
+        seconds = laps['LapTime'].dt.total_seconds().groupby(laps['Driver'])
+        values = seconds.min() if metric == "fastest" else seconds.median()
+    return {drv: float(v) for drv, v in values.dropna().items()}
+
+
+def load_summary(task: tuple) -> dict:
+    """
+    Load one session with the metric's profile and summarize it. Runs in a
+    worker process, so only the compact summary is sent back.
+
+    :param task: Tuple of (index, year, gp, sess_type, metric).
+    :return: Summary dict with index, label, values and team colors, or index, label and error.
+    """
+    index, year, gp, sess_type, metric = task
+    try:
+        init_cache()
+        session = get_session(year, gp, sess_type)
+        event_name = session.event['EventName']
+        touch_event(year, safe_name(event_name))
+        session.load(**PROFILES[METRICS[metric]])
+        results = session.results
+        colors = {
+            drv: f"#{color}" for drv, color in zip(results['Abbreviation'], results['TeamColor'])
+            if isinstance(color, str) and color
+        }
+        return {"index": index, "label": f"{year} {event_name}",
+                "values": summarize(session, metric), "colors": colors}
+    except Exception as e:
+        return {"index": index, "label": f"{year} {gp}", "error": str(e)}
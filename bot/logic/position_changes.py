@@ -16,19 +16,31 @@ def generate_position_changes_image(session) -> str:
         print("⚠ No laps available in this session.")
         return None
 
+    drivers = laps['Driver'].unique()
+    colors = {driver: get_driver_color(driver, session) for driver in drivers}
+    filename = make_data_filename("position_changes", session)
+    return plot_position_changes(laps[['Driver', 'LapNumber', 'Position']], colors, filename)
+
+
+def plot_position_changes(laps, colors: dict, filename: str) -> str:
+    """
+    Plot position by lap for each driver.
+
+    :param laps: DataFrame with Driver, LapNumber and Position columns.
+    :param colors: Mapping of driver to line color.
+    :param filename: Destination path.
+    :return: Path to the saved image.
+    """
     plt.style.use('dark_background')
     plotting.setup_mpl(misc_mpl_mods=False, color_scheme='fastf1')
 
-    drivers = laps['Driver'].unique()
     fig, ax = plt.subplots(figsize=(14, 8))
-    for driver in drivers:
-        drv_laps = laps.pick_drivers(driver)
+    for driver, drv_laps in laps.groupby('Driver', sort=False):
         if drv_laps.empty:
             continue
-        color = get_driver_color(driver, session)
         ax.plot(
             drv_laps['LapNumber'], drv_laps['Position'],
-            label=driver, color=color, linewidth=2
+            label=driver, color=colors.get(driver), linewidth=2
         )
 
     ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize=14, framealpha=0.8)
@@ -39,9 +51,8 @@ def generate_position_changes_image(session) -> str:
     ax.set_ylabel('Position', fontsize=16)
     ax.set_title("Position Changes During Race", fontsize=20, pad=15)
     ax.grid(True, alpha=0.3, linestyle='--')
-    plt.tight_layout()
+    fig.tight_layout()
 
-    filename = make_data_filename("position_changes", session)
     fig.savefig(filename, bbox_inches='tight', dpi=180)
     plt.close(fig)
     return filename
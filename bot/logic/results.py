@@ -1,8 +1,8 @@
 import re
-import fastf1
-import matplotlib.pyplot as plt
 import pandas as pd
 from logic.utils import safe_name, make_data_filename
+from logic.http_cache import get_session
+from logic.table_renderer import table_digest, is_cached, render_table
 
 
 DRIVER_TRANSLATION = {
@@ -41,15 +41,24 @@ def print_results(session) -> None:
         print("⚠ No session results available.")
         return
 
+    lines = (
+        results['Position'].astype(str).str.rjust(2) + ". "
+        + results['FullName'].astype(str).str.ljust(20)
+        + " (" + results['TeamName'].astype(str) + ") — Grid: "
+        + results['GridPosition'].astype(str) + ", Points: "
+        + results['Points'].astype(str) + ", Status: "
+        + results['Status'].astype(str)
+    )
     print("\n🏁 Session Results:\n")
-    for _, row in results.iterrows():
-        print(f"{row['Position']:>2}. {row['FullName']:<20} ({row['TeamName']}) — Grid: {row['GridPosition']}, Points: {row['Points']}, Status: {row['Status']}")
+    print("\n".join(lines))
 
 
 def generate_results_image(session) -> str:
     """
     Generate an image of the session results in table format.
 
+    The image is reused if it was already rendered from the same results.
+
     :param session: A FastF1 session object.
     :return: Path to the saved image.
     """
@@ -62,67 +71,37 @@ def generate_results_image(session) -> str:
     data = results[columns].astype(str).values.tolist()
     col_labels = ['Pos', 'Driver', 'Team', 'Grid', 'Pts', 'Status']
 
-    n_rows = len(data)
-    n_cols = len(col_labels)
-    cell_height = 0.5
-    cell_width = 2.0
-
-    fig_width = n_cols * cell_width
-    fig_height = max(4.5, n_rows * cell_height * 0.95)
-
-    plt.style.use('dark_background')
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
-    ax.axis('off')
-
-    header_color = "#24262b"
-    cell_color = "#181a20"
-    edge_color = "#444444"
-    font_color = "#f3f3f3"
-    header_font_color = "#ffe080"
-
-    table = ax.table(
-        cellText=data,
-        colLabels=col_labels,
-        cellLoc='center',
-        loc='center'
-    )
+    filename = make_data_filename("result", session)
+    digest = table_digest(col_labels, data)
+    if is_cached(filename, digest):
+        return filename
+    return render_table(col_labels, data, filename, digest)
 
-    table.auto_set_font_size(False)
-    table.set_fontsize(12)
-    table.scale(1.1, 1.15)
-
-    for (row, col), cell in table.get_celld().items():
-        cell.set_edgecolor(edge_color)
-        if row == 0:
-            cell.set_facecolor(header_color)
-            cell.set_text_props(weight='bold', color=header_font_color)
-            cell.set_height(cell_height * 0.9)
-        else:
-            cell.set_facecolor(cell_color)
-            cell.set_text_props(color=font_color)
-            cell.set_height(cell_height * 0.9)
-    for key in table.get_celld():
-        table.get_celld()[key].set_linewidth(1.2)
 
-    filename = make_data_filename("result", session)
-    fig.subplots_adjust(left=0.15, right=0.85, top=0.96, bottom=0.04)
-    fig.savefig(filename, bbox_inches='tight', dpi=180, facecolor="#181a20")
-    plt.close(fig)
-    return filename
+def safe_int_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Convert a column to integers, treating missing or invalid values as 0.
 
+    :param df: Source DataFrame.
+    :param column: Column name.
+    :return: Integer series aligned with df.
+    """
+    if column not in df:
+        return pd.Series(0, index=df.index, dtype=int)
+    return pd.to_numeric(df[column], errors='coerce').fillna(0).astype(int)
 
-def safe_int(val) -> int:
-    try:
-        return int(val) if pd.notna(val) else 0
-    except Exception:
-        return 0
 
+def safe_float_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Convert a column to floats, treating missing or invalid values as 0.0.
 
-def safe_float(val) -> float:
-    try:
-        return float(val) if pd.notna(val) else 0.0
-    except Exception:
-        return 0.0
+    :param df: Source DataFrame.
+    :param column: Column name.
+    :return: Float series aligned with df.
+    """
+    if column not in df:
+        return pd.Series(0.0, index=df.index, dtype=float)
+    return pd.to_numeric(df[column], errors='coerce').fillna(0.0).astype(float)
 
 
 def export_results_csv(session) -> str:
@@ -138,42 +117,36 @@ def export_results_csv(session) -> str:
         return None
 
     event = session.event
-    sprint_data = {}
+    sprint_laps = pd.Series(0, index=results.index, dtype=int)
+    sprint_points = pd.Series(0.0, index=results.index, dtype=float)
     try:
         gp_event = event['EventName']
-        sprint_session = fastf1.get_session(year, gp_event, 'Sprint')
-        sprint_session.load()
+        sprint_session = get_session(event['EventDate'].year, gp_event, 'Sprint')
+        sprint_session.load(laps=False, telemetry=False, weather=False, messages=False)
         sprint_results = sprint_session.results
         if not sprint_results.empty:
-            for _, row in sprint_results.iterrows():
-                sprint_data[row['Abbreviation']] = {
-                    "laps": int(row['Laps']),
-                    "points": float(row['Points']),
-                }
+            by_abbr = pd.DataFrame({
+                "laps": safe_int_column(sprint_results, 'Laps'),
+                "points": safe_float_column(sprint_results, 'Points'),
+            }).set_index(sprint_results['Abbreviation'])
+            sprint_laps = results['Abbreviation'].map(by_abbr['laps']).fillna(0).astype(int)
+            sprint_points = results['Abbreviation'].map(by_abbr['points']).fillna(0.0).astype(float)
             print("🏁 Sprint session has been loaded.")
     except Exception as e:
         print(f"⚠ No sprint session results available: {e}.")
 
-    rows = []
     gp_event = event['EventName']
     race_col_name = gp_event
-    for _, row in results.iterrows():
-        rus_name = DRIVER_TRANSLATION.get(row['FullName'], row['FullName'])
-        laps_val = row['Laps'] if 'Laps' in row and pd.notna(row['Laps']) else 0
-        abbreviation = row['Abbreviation']
-        sprint_laps = safe_int(sprint_data.get(abbreviation, {}).get("laps", 0))
-        sprint_points = safe_float(sprint_data.get(abbreviation, {}).get("points", 0))
-
-        rows.append({
-            race_col_name: rus_name,
-            "Позиция на старте": safe_int(row.get('GridPosition', 0)),
-            "Позиция на финише": safe_int(row.get('Position', 0)),
-            "Круги": safe_int(laps_val),
-            "Круги спринт": sprint_laps,
-            "Очки": safe_float(row.get('Points', 0)),
-            "Очки спринт": sprint_points
-        })
-    df = pd.DataFrame(rows)
+    rus_names = results['FullName'].map(DRIVER_TRANSLATION).fillna(results['FullName'])
+    df = pd.DataFrame({
+        race_col_name: rus_names.values,
+        "Позиция на старте": safe_int_column(results, 'GridPosition').values,
+        "Позиция на финише": safe_int_column(results, 'Position').values,
+        "Круги": safe_int_column(results, 'Laps').values,
+        "Круги спринт": sprint_laps.values,
+        "Очки": safe_float_column(results, 'Points').values,
+        "Очки спринт": sprint_points.values,
+    })
     driver_order = list(DRIVER_TRANSLATION.values())
     df[race_col_name] = pd.Categorical(df[race_col_name], categories=driver_order, ordered=True)
     df = df.sort_values(by=race_col_name, kind='stable').reset_index(drop=True)
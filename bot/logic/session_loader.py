@@ -1,4 +1,6 @@
-import fastf1
+from logic.http_cache import get_session, prefetch_session
+from logic.storage import touch_event
+from logic.utils import safe_name
 
 
 def load_session(year: int, gp: str, sess_type: str):
@@ -10,6 +12,8 @@ def load_session(year: int, gp: str, sess_type: str):
     :param sess_type: Session type.
     :return: A loaded FastF1 session object.
     """
-    session = fastf1.get_session(year, gp, sess_type)
+    session = get_session(year, gp, sess_type)
+    touch_event(year, safe_name(session.event['EventName']))
+    prefetch_session(session)
     session.load()
     return session
@@ -0,0 +1,372 @@
+import os
+import re
+import shutil
+import sqlite3
+import tarfile
+import time
+from datetime import date, timedelta
+from logic.http_cache import CACHE_DIR, HTTP_CACHE_FILE
+
+
+DATA_DIR = "data"
+# Subdirectories of DATA_DIR managed together with the top-level artifacts,
+# e.g. livetiming recordings written by logic/live.py.
+DATA_SUBDIRS = ("live",)
+INDEX_FILE = os.path.join(DATA_DIR, ".storage_index.sqlite")
+
+DATA_MAX_MB = int(os.getenv("STORAGE_DATA_MAX_MB", "500"))
+CACHE_MAX_MB = int(os.getenv("STORAGE_CACHE_MAX_MB", "4000"))
+HTTP_CACHE_MAX_MB = int(os.getenv("STORAGE_HTTP_CACHE_MAX_MB", "1000"))
+MAX_AGE_DAYS = int(os.getenv("STORAGE_MAX_AGE_DAYS", "180"))
+COLD_DAYS = int(os.getenv("STORAGE_COLD_DAYS", "30"))
+PIN_DAYS = int(os.getenv("STORAGE_PIN_DAYS", "14"))
+GC_INTERVAL_HOURS = float(os.getenv("STORAGE_GC_INTERVAL_HOURS", "6"))
+# Files written this recently are still in use (e.g. a live recording).
+ACTIVE_SECONDS = 600
+
+ARCHIVE_EXT = ".tar.gz"
+EVENT_DIR_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_(.+?)(\.tar\.gz)?$")
+
+
+def get_index() -> sqlite3.Connection:
+    """
+    Open the access index shared by all processes using the data volume.
+
+    :return: SQLite connection.
+    """
+    os.makedirs(DATA_DIR, exist_ok=True)
+    conn = sqlite3.connect(INDEX_FILE, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS entries (
+            path TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            size INTEGER NOT NULL DEFAULT 0,
+            last_access REAL NOT NULL
+        );
+    """)
+    return conn
+
+
+def touch(path: str, kind: str = "data") -> None:
+    """
+    Record an access to an artifact or cache entry.
+
+    :param path: File or directory path.
+    :param kind: Entry kind, "data" or "cache".
+    """
+    try:
+        conn = get_index()
+        with conn:
+            conn.execute(
+                "INSERT INTO entries (path, kind, last_access) VALUES (?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET last_access=excluded.last_access;",
+                (os.path.normpath(path), kind, time.time())
+            )
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠ Storage index unavailable: {e}.")
+
+
+def touch_event(year: int, event_name: str) -> None:
+    """
+    Record an access to the cached FastF1 data of an event, restoring it
+    first if the season was compressed.
+
+    :param year: Season year.
+    :param event_name: Event name with non-word characters replaced by "_".
+    """
+    season_dir = os.path.join(CACHE_DIR, str(year))
+    if not os.path.isdir(season_dir):
+        return
+    for name in os.listdir(season_dir):
+        match = EVENT_DIR_RE.match(name)
+        if not match or match.group(2) != event_name:
+            continue
+        path = os.path.join(season_dir, name)
+        if match.group(3):
+            path = restore_archive(path)
+        touch(path, "cache")
+
+
+def dir_size(path: str) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                total += os.path.getsize(os.path.join(root, f))
+            except OSError:
+                pass
+    return total
+
+
+def newest_mtime(path: str) -> float:
+    if os.path.isfile(path):
+        return os.path.getmtime(path)
+    newest = 0.0
+    for root, _, files in os.walk(path):
+        for f in files:
+            try:
+                newest = max(newest, os.path.getmtime(os.path.join(root, f)))
+            except OSError:
+                pass
+    return newest or os.path.getmtime(path)
+
+
+def scan_data() -> list:
+    """
+    List chart and CSV artifacts in the data directory and recordings in
+    its managed subdirectories.
+
+    :return: List of (path, size, mtime) tuples.
+    """
+    entries = []
+    for directory in [DATA_DIR] + [os.path.join(DATA_DIR, sub) for sub in DATA_SUBDIRS]:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            path = os.path.normpath(os.path.join(directory, name))
+            if name.startswith(".") or not os.path.isfile(path):
+                continue
+            entries.append((path, os.path.getsize(path), os.path.getmtime(path)))
+    return entries
+
+
+def scan_cache() -> list:
+    """
+    List per-event directories and archives in the FastF1 cache.
+
+    :return: List of (path, size, mtime, season, event_name, event_date) tuples.
+    """
+    entries = []
+    if not os.path.isdir(CACHE_DIR):
+        return entries
+    for season in os.listdir(CACHE_DIR):
+        season_dir = os.path.join(CACHE_DIR, season)
+        if not season.isdigit() or not os.path.isdir(season_dir):
+            continue
+        for name in os.listdir(season_dir):
+            match = EVENT_DIR_RE.match(name)
+            if not match:
+                continue
+            path = os.path.normpath(os.path.join(season_dir, name))
+            size = os.path.getsize(path) if match.group(3) else dir_size(path)
+            entries.append((path, size, newest_mtime(path), int(season),
+                            match.group(2), date.fromisoformat(match.group(1))))
+    return entries
+
+
+def http_cache_size(db_path: str) -> int:
+    return sum(os.path.getsize(p) for p in (db_path, db_path + "-wal") if os.path.exists(p))
+
+
+def trim_http_cache(db_path: str, max_bytes: int, dry_run: bool = False) -> int:
+    """
+    Shrink the requests-cache SQLite database: drop expired responses, then
+    the oldest ones until the stored responses fit in max_bytes. Only if rows
+    were deleted is the file compacted, since VACUUM locks out the other
+    processes sharing the cache. Rows are replaced on refresh, so rowid
+    order is write order.
+
+    :param db_path: Path to fastf1_http_cache.sqlite.
+    :param max_bytes: Size quota for the database.
+    :param dry_run: Only report what would be freed.
+    :return: Bytes freed (estimated for dry runs).
+    """
+    if not os.path.exists(db_path):
+        return 0
+    before = http_cache_size(db_path)
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table';")}
+        if "responses" not in tables:
+            return 0
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(responses);")}
+        expired_sql = "expires IS NOT NULL AND expires < ?" if "expires" in columns else "0"
+        expired_args = (int(time.time()),) if "expires" in columns else ()
+        expired = conn.execute(
+            f"SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses WHERE {expired_sql};", expired_args
+        ).fetchone()[0]
+        stored = conn.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM responses;").fetchone()[0]
+        excess = max(0, stored - expired - max_bytes)
+        if dry_run:
+            return expired + excess
+        with conn:
+            deleted = conn.execute(f"DELETE FROM responses WHERE {expired_sql};", expired_args).rowcount
+            if excess:
+                cutoff, freed = None, 0
+                for rowid, size in conn.execute("SELECT rowid, LENGTH(value) FROM responses ORDER BY rowid;"):
+                    freed += size or 0
+                    cutoff = rowid
+                    if freed >= excess:
+                        break
+                deleted += conn.execute("DELETE FROM responses WHERE rowid <= ?;", (cutoff,)).rowcount
+            if deleted and "redirects" in tables:
+                conn.execute("DELETE FROM redirects WHERE value NOT IN (SELECT key FROM responses);")
+        if not deleted:
+            return 0
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE);")
+        conn.execute("VACUUM;")
+    except sqlite3.Error as e:
+        print(f"⚠ Failed to trim HTTP cache: {e}.")
+    finally:
+        conn.close()
+    return max(0, before - http_cache_size(db_path))
+
+
+def compress_event(path: str) -> str:
+    """
+    Pack a cached event directory into a gzip tarball and remove the directory.
+
+    :param path: Event directory.
+    :return: Path to the archive.
+    """
+    archive = path + ARCHIVE_EXT
+    tmp = archive + ".tmp"
+    mtime = newest_mtime(path)
+    with tarfile.open(tmp, "w:gz") as tar:
+        tar.add(path, arcname=os.path.basename(path))
+    os.utime(tmp, (mtime, mtime))
+    os.replace(tmp, archive)
+    shutil.rmtree(path, ignore_errors=True)
+    return archive
+
+
+def restore_archive(archive: str) -> str:
+    """
+    Unpack a compressed event back into the cache so FastF1 can read it.
+
+    :param archive: Path to the archive.
+    :return: Path to the restored directory.
+    """
+    path = archive[:-len(ARCHIVE_EXT)]
+    with tarfile.open(archive, "r:gz") as tar:
+        tar.extractall(os.path.dirname(archive), filter="data")
+    os.remove(archive)
+    return path
+
+
+def remove_entry(path: str) -> None:
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
+
+
+def evict(entries: list, max_bytes: int, max_age: float, now: float) -> list:
+    """
+    Pick entries to delete: everything older than max_age, then least
+    recently used entries until the total fits in max_bytes.
+
+    :param entries: List of dicts with path, size, last_access and pinned.
+    :param max_bytes: Size quota.
+    :param max_age: Age quota in seconds.
+    :param now: Current timestamp.
+    :return: Entries to delete.
+    """
+    total = sum(e["size"] for e in entries)
+    victims = []
+    for e in sorted(entries, key=lambda e: e["last_access"]):
+        if e["pinned"]:
+            continue
+        if now - e["last_access"] > max_age or total > max_bytes:
+            victims.append(e)
+            total -= e["size"]
+    return victims
+
+
+def run_gc(dry_run: bool = False) -> dict:
+    """
+    Enforce size and age quotas on the data and cache volumes, compress cold
+    seasons and drop index rows for entries that no longer exist.
+
+    :param dry_run: Only report what would be done.
+    :return: Summary with counts and freed bytes.
+    """
+    now = time.time()
+    today = date.today()
+    pin_from = today - timedelta(days=PIN_DAYS)
+    summary = {"deleted": 0, "compressed": 0, "freed_bytes": 0, "pinned": 0, "http_cache_bytes": 0}
+
+    conn = get_index()
+    accessed = dict(conn.execute("SELECT path, last_access FROM entries;").fetchall())
+
+    cache_entries = []
+    pinned_events = set()
+    for path, size, mtime, season, event, event_date in scan_cache():
+        pinned = event_date >= pin_from
+        if pinned:
+            pinned_events.add(f"_{season}_{event}_")
+        cache_entries.append({
+            "path": path, "size": size, "season": season, "pinned": pinned,
+            "last_access": max(mtime, accessed.get(path, 0)),
+        })
+
+    # Artifacts are named "<prefix>_<year>_<event>_<session>.<ext>" by make_data_filename().
+    data_entries = [{
+        "path": path, "size": size,
+        "pinned": now - mtime < ACTIVE_SECONDS or any(key in os.path.basename(path) for key in pinned_events),
+        "last_access": max(mtime, accessed.get(path, 0)),
+    } for path, size, mtime in scan_data()]
+
+    # The HTTP cache shares the cache volume: trim it to its own quota first,
+    # then give the event directories whatever is left of CACHE_MAX_MB.
+    http_db = os.path.join(CACHE_DIR, HTTP_CACHE_FILE)
+    http_freed = trim_http_cache(http_db, HTTP_CACHE_MAX_MB * 1024 * 1024, dry_run)
+    http_size = max(0, http_cache_size(http_db) - (http_freed if dry_run else 0))
+    summary["freed_bytes"] += http_freed
+    summary["http_cache_bytes"] = http_size
+
+    max_age = MAX_AGE_DAYS * 86400
+    victims = evict(data_entries, DATA_MAX_MB * 1024 * 1024, max_age, now)
+    victims += evict(cache_entries, max(0, CACHE_MAX_MB * 1024 * 1024 - http_size), max_age, now)
+    removed = {e["path"] for e in victims}
+    for e in victims:
+        summary["deleted"] += 1
+        summary["freed_bytes"] += e["size"]
+        if not dry_run:
+            remove_entry(e["path"])
+
+    last_season_access = {}
+    for e in cache_entries:
+        if e["path"] not in removed:
+            last_season_access[e["season"]] = max(last_season_access.get(e["season"], 0), e["last_access"])
+    cold_seasons = {
+        season for season, last in last_season_access.items()
+        if season < today.year and now - last > COLD_DAYS * 86400
+    }
+    for e in cache_entries:
+        if e["path"] in removed or e["season"] not in cold_seasons or e["path"].endswith(ARCHIVE_EXT):
+            continue
+        summary["compressed"] += 1
+        if not dry_run:
+            e["path"] = compress_event(e["path"])
+            e["size"] = os.path.getsize(e["path"])
+
+    summary["pinned"] = sum(e["pinned"] for e in data_entries + cache_entries)
+    if not dry_run:
+        rows = [(e["path"], "data", e["size"], e["last_access"]) for e in data_entries if e["path"] not in removed]
+        rows += [(e["path"], "cache", e["size"], e["last_access"]) for e in cache_entries if e["path"] not in removed]
+        with conn:
+            conn.executemany("DELETE FROM entries WHERE path=?;", [(p,) for p in accessed if not os.path.exists(p)])
+            conn.executemany(
+                "INSERT INTO entries (path, kind, size, last_access) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(path) DO UPDATE SET size=excluded.size, last_access=excluded.last_access;",
+                rows
+            )
+    conn.close()
+    return summary
+
+
+def format_gc_summary(summary: dict) -> str:
+    """
+    Format a run_gc() summary for display.
+
+    :param summary: Result of run_gc().
+    :return: Human-readable summary.
+    """
+    return (
+        f"Deleted: {summary['deleted']} ({summary['freed_bytes'] / 1024 / 1024:.1f} MB), "
+        f"compressed: {summary['compressed']}, pinned: {summary['pinned']}, "
+        f"HTTP cache: {summary['http_cache_bytes'] / 1024 / 1024:.1f} MB"
+    )
@@ -11,19 +11,42 @@ def generate_strategy_image(session) -> str:
     :param session: A FastF1 session object.
     :return: Path to the saved image.
     """
+    stint_info = build_stint_info(session.laps)
+    filename = make_data_filename("strategy", session)
+    return plot_strategy(stint_info, lambda compound: get_compound_color(compound, session), filename)
+
+
+def build_stint_info(laps):
+    """
+    Summarize laps into one row per driver stint.
+
+    :param laps: DataFrame with Driver, Stint, Compound and LapNumber columns.
+    :return: DataFrame with Driver, Stint, Compound, StartLap, EndLap and StintLength.
+    """
+    stints = laps[["Driver", "Stint", "Compound", "LapNumber"]]
+    stint_info = stints.groupby(["Driver", "Stint", "Compound"])['LapNumber'].agg(['min', 'max', 'count']).reset_index()
+    return stint_info.rename(columns={'count': 'StintLength', 'min': 'StartLap', 'max': 'EndLap'})
+
+
+def plot_strategy(stint_info, compound_color, filename: str) -> str:
+    """
+    Plot each driver's stints as horizontal bars colored by compound.
+
+    :param stint_info: Result of build_stint_info().
+    :param compound_color: Callable returning the color of a compound.
+    :param filename: Destination path.
+    :return: Path to the saved image.
+    """
     plt.style.use('dark_background')
     plotting.setup_mpl(misc_mpl_mods=False, color_scheme='fastf1')
 
-    stints = session.laps[["Driver", "Stint", "Compound", "LapNumber"]]
-    stint_info = stints.groupby(["Driver", "Stint", "Compound"])['LapNumber'].agg(['min', 'max', 'count']).reset_index()
-    stint_info = stint_info.rename(columns={'count': 'StintLength', 'min': 'StartLap', 'max': 'EndLap'})
     drivers = stint_info["Driver"].unique()
     fig, ax = plt.subplots(figsize=(14, len(drivers) * 0.6 + 2))
     for i, drv in enumerate(drivers):
         stints = stint_info[stint_info["Driver"] == drv]
         label = drv
         for _, stint in stints.iterrows():
-            color = get_compound_color(stint["Compound"], session)
+            color = compound_color(stint["Compound"])
             ax.barh(
                 label,
                 stint["StintLength"],
@@ -46,7 +69,7 @@ def generate_strategy_image(session) -> str:
 
     compounds = stint_info["Compound"].unique()
     legend_handles = [
-        plt.Rectangle((0, 0), 1, 1, color=get_compound_color(comp, session), label=comp)
+        plt.Rectangle((0, 0), 1, 1, color=compound_color(comp), label=comp)
         for comp in compounds
     ]
     ax.legend(handles=legend_handles, title="Compound", bbox_to_anchor=(1.02, 1), loc='upper left', fontsize=14)
@@ -56,9 +79,8 @@ def generate_strategy_image(session) -> str:
     ax.set_title("Tire Strategy by Driver", fontsize=20, pad=15)
     ax.tick_params(axis='both', which='major', labelsize=13)
     ax.grid(True, axis='x', alpha=0.3, linestyle='--')
-    plt.tight_layout()
+    fig.tight_layout()
 
-    filename = make_data_filename("strategy", session)
     fig.savefig(filename, bbox_inches='tight', dpi=180)
     plt.close(fig)
     return filename
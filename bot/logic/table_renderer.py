@@ -0,0 +1,122 @@
+import hashlib
+import os
+from functools import lru_cache
+from matplotlib import font_manager
+from PIL import Image, ImageDraw, ImageFont, PngImagePlugin
+
+
+TABLE_STYLE = {
+    "background": "#181a20",
+    "header_color": "#24262b",
+    "cell_color": "#181a20",
+    "edge_color": "#444444",
+    "font_color": "#f3f3f3",
+    "header_font_color": "#ffe080",
+    "font_size": 30,
+    "edge_width": 2,
+    "padding_x": 28,
+    "padding_y": 16,
+    "margin": 24,
+}
+
+DIGEST_KEY = "table-digest"
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font once per (size, weight) and reuse it for all renders.
+
+    :param size: Font size in pixels.
+    :param bold: Whether to load the bold variant.
+    :return: A Pillow font object.
+    """
+    props = font_manager.FontProperties(family="DejaVu Sans", weight="bold" if bold else "normal")
+    return ImageFont.truetype(font_manager.findfont(props), size)
+
+
+def table_digest(col_labels: list, rows: list) -> str:
+    """
+    Compute a fingerprint of the table contents and style.
+
+    :param col_labels: Header labels.
+    :param rows: Table rows as lists of strings.
+    :return: Hex digest identifying the rendered output.
+    """
+    h = hashlib.sha1()
+    h.update(repr(sorted(TABLE_STYLE.items())).encode("utf-8"))
+    h.update("\x1f".join(col_labels).encode("utf-8"))
+    for row in rows:
+        h.update(b"\x1e")
+        h.update("\x1f".join(row).encode("utf-8"))
+    return h.hexdigest()
+
+
+def is_cached(filename: str, digest: str) -> bool:
+    """
+    Check whether an image with the given content digest is already on disk.
+
+    :param filename: Path to the PNG file.
+    :param digest: Expected table digest.
+    :return: True if the file exists and was rendered from the same data.
+    """
+    if not os.path.exists(filename):
+        return False
+    try:
+        with Image.open(filename) as img:
+            return img.info.get(DIGEST_KEY) == digest
+    except Exception:
+        return False
+
+
+def render_table(col_labels: list, rows: list, filename: str, digest: str = None) -> str:
+    """
+    Draw a styled table directly with Pillow and save it as PNG.
+
+    :param col_labels: Header labels.
+    :param rows: Table rows as lists of strings.
+    :param filename: Destination path.
+    :param digest: Optional digest stored in the PNG metadata for cache checks.
+    :return: Path to the saved image.
+    """
+    style = TABLE_STYLE
+    font = get_font(style["font_size"])
+    header_font = get_font(style["font_size"], bold=True)
+    pad_x, pad_y, margin = style["padding_x"], style["padding_y"], style["margin"]
+
+    col_widths = [header_font.getlength(label) for label in col_labels]
+    for row in rows:
+        col_widths = [max(w, font.getlength(text)) for w, text in zip(col_widths, row)]
+    col_widths = [int(w) + 2 * pad_x for w in col_widths]
+    ascent, descent = header_font.getmetrics()
+    row_height = ascent + descent + 2 * pad_y
+
+    width = sum(col_widths) + 2 * margin
+    height = row_height * (len(rows) + 1) + 2 * margin
+    img = Image.new("RGB", (width, height), style["background"])
+    draw = ImageDraw.Draw(img)
+
+    xs = [margin]
+    for w in col_widths:
+        xs.append(xs[-1] + w)
+
+    for r, cells in enumerate([col_labels] + rows):
+        top = margin + r * row_height
+        fill = style["header_color"] if r == 0 else style["cell_color"]
+        cell_font = header_font if r == 0 else font
+        text_color = style["header_font_color"] if r == 0 else style["font_color"]
+        for c, text in enumerate(cells):
+            draw.rectangle(
+                (xs[c], top, xs[c + 1], top + row_height),
+                fill=fill, outline=style["edge_color"], width=style["edge_width"]
+            )
+            draw.text(
+                ((xs[c] + xs[c + 1]) / 2, top + row_height / 2), text,
+                font=cell_font, fill=text_color, anchor="mm"
+            )
+
+    info = PngImagePlugin.PngInfo()
+    if digest:
+        info.add_text(DIGEST_KEY, digest)
+    img.save(filename, pnginfo=info, dpi=(180, 180))
+    return filename
@@ -1,5 +1,6 @@
 import os
 import re
+from logic.storage import touch
 
 
 def safe_name(s: str) -> str:
@@ -27,4 +28,35 @@ def make_data_filename(prefix: str, session, ext: str = "png") -> str:
     type_name = safe_name(session.name)
     filename = f"data/{prefix}_{year}_{gp}_{type_name}.{ext}"
     os.makedirs("data", exist_ok=True)
+    touch(filename)
+    return filename
+
+
+def make_live_filename(prefix: str, feed: str, ext: str = "png") -> str:
+    """
+    Build the path of an artifact rendered from a live timing feed.
+
+    :param prefix: Artifact kind, e.g. "position_changes".
+    :param feed: Name of the feed, e.g. the recording file name.
+    :param ext: File extension.
+    :return: Path inside the data directory.
+    """
+    filename = f"data/{prefix}_live_{safe_name(feed)}.{ext}"
+    os.makedirs("data", exist_ok=True)
+    touch(filename)
+    return filename
+
+
+def make_multi_filename(prefix: str, query: str, ext: str = "png") -> str:
+    """
+    Build the path of an artifact summarizing several sessions.
+
+    :param prefix: Artifact kind, e.g. "multi_pace".
+    :param query: Description of the compared sessions.
+    :param ext: File extension.
+    :return: Path inside the data directory.
+    """
+    filename = f"data/{prefix}_{safe_name(query)}.{ext}"
+    os.makedirs("data", exist_ok=True)
+    touch(filename)
     return filename
@@ -0,0 +1,88 @@
+import argparse
+import hashlib
+import json
+import os
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+UPSTREAMS = {
+    "/livetiming": "https://livetiming.formula1.com",
+    "/ergast": "https://api.jolpi.ca/ergast/f1",
+}
+
+
+def fixture_path(directory: str, path: str) -> str:
+    return os.path.join(directory, hashlib.sha1(path.encode("utf-8")).hexdigest())
+
+
+def make_handler(mode: str, directory: str):
+    class StandinHandler(BaseHTTPRequestHandler):
+        """
+        Serves FastF1 requests from recorded fixtures. In record mode, misses
+        are fetched from the real upstream and saved.
+        """
+
+        def do_GET(self):
+            fixture = fixture_path(directory, self.path)
+            if os.path.exists(fixture):
+                with open(fixture + ".json", encoding="utf-8") as f:
+                    meta = json.load(f)
+                with open(fixture, "rb") as f:
+                    self.reply(meta["status"], meta["content_type"], f.read())
+                return
+            if mode != "record":
+                print(f"MISS {self.path}", flush=True)
+                self.reply(404, "text/plain", b"not recorded")
+                return
+
+            prefix = next((p for p in UPSTREAMS if self.path.startswith(p + "/")), None)
+            if prefix is None:
+                self.reply(404, "text/plain", b"unknown upstream")
+                return
+            url = UPSTREAMS[prefix] + self.path[len(prefix):]
+            try:
+                with urllib.request.urlopen(url, timeout=60) as resp:
+                    status, content_type, body = resp.status, resp.headers.get("Content-Type", ""), resp.read()
+            except urllib.error.HTTPError as e:
+                status, content_type, body = e.code, e.headers.get("Content-Type", ""), e.read()
+            with open(fixture, "wb") as f:
+                f.write(body)
+            with open(fixture + ".json", "w", encoding="utf-8") as f:
+                json.dump({"path": self.path, "status": status, "content_type": content_type}, f)
+            self.reply(status, content_type, body)
+
+        def reply(self, status: int, content_type: str, body: bytes):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return StandinHandler
+
+
+def main() -> None:
+    """
+    Local stand-in for the livetiming and Ergast servers, for running the
+    CLI offline. Point FASTF1_LIVETIMING_URL at http://<host>:<port>/livetiming
+    and FASTF1_ERGAST_URL at http://<host>:<port>/ergast.
+    """
+    parser = argparse.ArgumentParser(description="Stand-in HTTP server for FastF1 requests")
+    parser.add_argument("--mode", choices=["record", "replay"], default="replay", help="Record from upstream or replay fixtures only")
+    parser.add_argument("--dir", type=str, default="data/standin", help="Fixture directory")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    args = parser.parse_args()
+
+    os.makedirs(args.dir, exist_ok=True)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.mode, args.dir))
+    print(f"Stand-in server ({args.mode}) on port {args.port}", flush=True)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,28 @@
 import os
+import time
 import logging
 import asyncio
 from aiogram import Bot, Dispatcher, types
 from aiogram import F
 from aiogram.filters import Command
 from aiogram.enums import ParseMode
-from aiogram.types import FSInputFile
+from aiogram.types import FSInputFile, InputMediaPhoto
 from aiogram.client.default import DefaultBotProperties
 
 from dotenv import load_dotenv
 
+from logic.http_cache import init_cache, format_cache_stats
 from logic.session_loader import load_session
+from logic.storage import run_gc, format_gc_summary, GC_INTERVAL_HOURS
 from logic.best_laps import generate_best_laps_image, generate_laptime_distribution_image
 from logic.results import generate_results_image, export_results_csv
 from logic.position_changes import generate_position_changes_image
 from logic.strategy import generate_strategy_image
 from logic.driver_styling import generate_driver_styling_image
+from logic.compare import generate_compare_image
+from logic.degradation import compute_degradation, generate_degradation_image, generate_degradation_table_image
+from logic.multi_session import parse_years, compare_sessions, generate_multi_session_image, METRICS
+from logic.live import LIVE_DIR, replay_recording, stream_live, run_feed
 from logic.db import create_users_table, add_user, list_users, is_user_exists
 
 
@@ -31,12 +38,29 @@ bot = Bot(
     default=DefaultBotProperties(parse_mode=ParseMode.MARKDOWN)
 )
 dp = Dispatcher()
+background_tasks = set()
+live_subscribers = {}
+live_task = None
+
+
+async def storage_gc_loop():
+    while True:
+        try:
+            summary = await asyncio.to_thread(run_gc)
+            logging.info("Storage GC: %s", format_gc_summary(summary))
+        except Exception as e:
+            logging.warning("Storage GC failed: %s", e)
+        await asyncio.sleep(GC_INTERVAL_HOURS * 3600)
 
 
 @dp.startup()
 async def on_startup(bot):
     await create_users_table()
     print("DB tables created.")
+    print(f"FastF1 cache: {init_cache()}")
+    task = asyncio.create_task(storage_gc_loop())
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
 
 
 @dp.message(F.text.startswith("start"))
@@ -48,8 +72,13 @@ async def cmd_start(message: types.Message):
         "position_changes <год> <gp> <тип>\n"
         "strategy <год> <gp> <тип>\n"
         "driver_styling <год> <gp> <тип> <driver>\n"
+        "degradation <год> <gp> <тип>\n"
+        "compare <год> <gp> <тип> <driver1> <driver2>\n"
+        "multi <fastest|pace|results> <годы> <gp,gp|lastN> <тип> [driver,driver]\n"
+        "Пример: multi pace 2024 last5 R LEC\n"
         "Пример: best_laps 2024 Monaco R\n"
         "Для driver_styling: driver_styling 2024 Monaco R LEC\n"
+        "live_subscribe / live_unsubscribe — live графики текущей сессии\n"
     )
 
 
@@ -89,6 +118,101 @@ async def list_users_cmd(message: types.Message):
         await message.answer(text)
 
 
+@dp.message(F.text.startswith("cache_stats"))
+async def cache_stats_cmd(message: types.Message):
+    if message.from_user.id != TELEGRAM_ADMIN_ID:
+        await message.answer("❌ Нет прав.")
+        return
+    await message.answer(format_cache_stats())
+
+
+async def publish_live(path: str):
+    for chat_id, message_id in list(live_subscribers.items()):
+        try:
+            if message_id is None:
+                msg = await bot.send_photo(chat_id, FSInputFile(path), caption="Live")
+                live_subscribers[chat_id] = msg.message_id
+            else:
+                await bot.edit_message_media(
+                    media=InputMediaPhoto(media=FSInputFile(path), caption="Live"),
+                    chat_id=chat_id, message_id=message_id
+                )
+        except Exception as e:
+            logging.warning("Live update for chat %s failed: %s", chat_id, e)
+
+
+def start_live_feed(messages, feed: str):
+    global live_task
+    for chat_id in live_subscribers:
+        live_subscribers[chat_id] = None
+    live_task = asyncio.create_task(run_feed(messages, feed, publish_live))
+
+
+@dp.message(F.text.startswith("live_start"))
+async def live_start_cmd(message: types.Message):
+    if message.from_user.id != TELEGRAM_ADMIN_ID:
+        await message.answer("❌ Нет прав.")
+        return
+    if live_task and not live_task.done():
+        await message.answer("❌ Live уже запущен.")
+        return
+    feed = time.strftime("%Y%m%d_%H%M%S")
+    start_live_feed(stream_live(os.path.join(LIVE_DIR, f"{feed}.txt")), feed)
+    await message.answer(f"📡 Live запущен: {feed}")
+
+
+@dp.message(F.text.startswith("live_replay"))
+async def live_replay_cmd(message: types.Message):
+    if message.from_user.id != TELEGRAM_ADMIN_ID:
+        await message.answer("❌ Нет прав.")
+        return
+    args = message.text.strip().split()
+    if len(args) < 2:
+        await message.answer("Формат: live_replay <file> [speed]")
+        return
+    if live_task and not live_task.done():
+        await message.answer("❌ Live уже запущен.")
+        return
+    path = os.path.join(LIVE_DIR, os.path.basename(args[1]))
+    if not os.path.exists(path):
+        await message.answer(f"❌ Файл не найден: {path}")
+        return
+    speed = float(args[2]) if len(args) > 2 else None
+    feed = os.path.splitext(os.path.basename(path))[0]
+    start_live_feed(replay_recording(path, speed), feed)
+    await message.answer(f"📡 Replay запущен: {feed}")
+
+
+@dp.message(F.text.startswith("live_stop"))
+async def live_stop_cmd(message: types.Message):
+    if message.from_user.id != TELEGRAM_ADMIN_ID:
+        await message.answer("❌ Нет прав.")
+        return
+    if live_task and not live_task.done():
+        live_task.cancel()
+        # Wait for the feed to close its source, which stops the live recorder.
+        try:
+            await live_task
+        except (asyncio.CancelledError, Exception):
+            pass
+    await message.answer("⏹ Live остановлен.")
+
+
+@dp.message(F.text.startswith("live_subscribe"))
+async def live_subscribe_cmd(message: types.Message):
+    if not await is_allowed(message.from_user.id):
+        await message.answer("❌ Нет доступа. Обратитесь к администратору.")
+        return
+    live_subscribers.setdefault(message.chat.id, None)
+    await message.answer("✅ Подписка на live обновления оформлена.")
+
+
+@dp.message(F.text.startswith("live_unsubscribe"))
+async def live_unsubscribe_cmd(message: types.Message):
+    live_subscribers.pop(message.chat.id, None)
+    await message.answer("✅ Подписка на live обновления отменена.")
+
+
 def parse_args(text: str, need_driver: bool = False):
     try:
         args = text.strip().split()
@@ -180,6 +304,72 @@ async def driver_styling_cmd(message: types.Message):
     await check_and_run(handler, message, need_driver=True)
 
 
+@dp.message(F.text.startswith("degradation"))
+async def degradation_cmd(message: types.Message):
+    async def handler(msg, year, gp, sess_type, driver):
+        try:
+            session = load_session(year, gp, sess_type)
+            result = compute_degradation(session)
+            if result.empty:
+                await msg.answer("❌ Нет стинтов достаточной длины для оценки деградации.")
+                return
+            path1 = generate_degradation_table_image(session, result)
+            path2 = generate_degradation_image(session, result)
+            await msg.answer_document(FSInputFile(path1), caption="Tyre Degradation Ranking")
+            await msg.answer_document(FSInputFile(path2), caption="Tyre Degradation")
+        except Exception as e:
+            await msg.answer(f"Ошибка: {e}")
+    await check_and_run(handler, message)
+
+
+@dp.message(F.text.startswith("compare"))
+async def compare_cmd(message: types.Message):
+    async def handler(msg, year, gp, sess_type, driver):
+        args = msg.text.strip().split()
+        if len(args) < 6:
+            await msg.answer("Формат: compare <год> <gp> <тип> <driver1> <driver2>")
+            return
+        driver2 = args[5].upper()
+        try:
+            session = load_session(year, gp, sess_type)
+            path = generate_compare_image(session, driver, driver2)
+            if path is None:
+                await msg.answer(f"❌ Нет быстрого круга для {driver} или {driver2}.")
+                return
+            await msg.answer_document(FSInputFile(path), caption=f"{driver2} vs {driver}")
+        except Exception as e:
+            await msg.answer(f"Ошибка: {e}")
+    await check_and_run(handler, message, need_driver=True)
+
+
+@dp.message(F.text.startswith("multi"))
+async def multi_cmd(message: types.Message):
+    if not await is_allowed(message.from_user.id):
+        await message.answer("❌ Нет доступа. Обратитесь к администратору.")
+        return
+    args = message.text.strip().split()
+    if len(args) < 5 or args[1] not in METRICS:
+        await message.answer("❌ Формат: multi <fastest|pace|results> <годы> <gp,gp|lastN> <тип> [driver,driver]")
+        return
+    metric, years_spec, gps, sess_type = args[1], args[2], args[3], args[4].upper()
+    drivers = [drv.upper() for drv in args[5].split(",")] if len(args) > 5 else None
+    try:
+        years = parse_years(years_spec)
+        summaries = await asyncio.to_thread(compare_sessions, years, gps, sess_type, metric)
+        query = f"{years_spec}_{gps}_{sess_type}_{args[5] if drivers else 'top'}"
+        path = generate_multi_session_image(summaries, metric, query, drivers)
+        if path is None:
+            await message.answer("❌ Нет данных по выбранным сессиям.")
+            return
+        errors = [f"{s['label']}: {s['error']}" for s in summaries if "error" in s]
+        caption = "Multi-session comparison"
+        if errors:
+            caption += "\n⚠ " + "\n⚠ ".join(errors)
+        await message.answer_document(FSInputFile(path), caption=caption[:1024])
+    except Exception as e:
+        await message.answer(f"Ошибка: {e}")
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     asyncio.run(dp.start_polling(bot))
@@ -7,6 +7,7 @@ TYPE="R"
 DRIVERS=("VER" "LEC" "NOR")
 
 RUN_SCRIPT="./run.sh"
+IMAGE_NAME="racepagebot"
 
 echo "=== Testing: Best Laps + Laptime Distribution ==="
 $RUN_SCRIPT --year "$YEAR" --gp "$GP" --type "$TYPE" --best-laps || exit 1
@@ -30,5 +31,41 @@ for drv in "${DRIVERS[@]}"; do
   $RUN_SCRIPT --year "$YEAR" --gp "$GP" --type "$TYPE" --driver-styling --driver "$drv" || exit 1
 done
 
+echo
+echo "=== Testing: Tyre Degradation ==="
+$RUN_SCRIPT --year "$YEAR" --gp "$GP" --type "$TYPE" --degradation || exit 1
+
+echo
+echo "=== Testing: Driver Comparison ==="
+$RUN_SCRIPT --year "$YEAR" --gp "$GP" --type "$TYPE" --compare VER LEC || exit 1
+
+echo
+echo "=== Testing: Multi-session comparison ==="
+$RUN_SCRIPT --multi pace --years 2024 --gp last3 --type "$TYPE" || exit 1
+
+echo
+echo "=== Testing: Storage GC (dry run) ==="
+$RUN_SCRIPT --gc --dry-run || exit 1
+
+echo
+echo "=== Testing: Live timing replay ==="
+$RUN_SCRIPT --live-replay test_data/livetiming_sample.txt || exit 1
+
+echo
+echo "=== Testing: Stand-in HTTP server (record, then replay offline) ==="
+for mode in record replay; do
+  network=$([ "$mode" = "replay" ] && echo "none" || echo "bridge")
+  docker run --rm --network "$network" \
+    -e FASTF1_LIVETIMING_URL=http://127.0.0.1:8765/livetiming \
+    -e FASTF1_ERGAST_URL=http://127.0.0.1:8765/ergast \
+    -e FASTF1_CACHE_DIR=/tmp/fastf1_standin \
+    -v "$(pwd)/data":/app/data -w /app "$IMAGE_NAME" \
+    sh -c "python bot/standin_server.py --mode $mode --dir data/standin & sleep 1; python bot/cli.py --year $YEAR --gp '$GP' --type $TYPE --results --cache-stats" || exit 1
+done
+
+echo
+echo "=== Testing: HTTP cache statistics against the stand-in server ==="
+docker run --rm --network none -w /app "$IMAGE_NAME" python bot/check_transport_stats.py || exit 1
+
 echo
 echo "✅ All CLI tests completed successfully!"